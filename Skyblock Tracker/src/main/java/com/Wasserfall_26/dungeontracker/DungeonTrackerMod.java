@@ -22,6 +22,9 @@ import net.minecraftforge.fml.common.gameevent.TickEvent;
 import org.lwjgl.input.Keyboard;
 
 import java.io.*;
+import java.net.InetSocketAddress;
+import java.net.Socket;
+import java.nio.charset.StandardCharsets;
 import java.nio.file.Files;
 import java.nio.file.StandardCopyOption;
 import java.util.LinkedList;
@@ -37,10 +40,20 @@ public class DungeonTrackerMod {
 
     private static final Pattern PLAYER_NAME_PATTERN = Pattern.compile("\\b([A-Za-z0-9_]{3,16})\\b");
 
+    // Local IPC channel of the running tracker (must match IPC_PORT in skyblock_tracker.py)
+    private static final String IPC_HOST = "127.0.0.1";
+    private static final int IPC_PORT = 47615;
+    private static final int IPC_CONNECT_TIMEOUT_MS = 250;
+    // The tracker answers every line with this, so another program on the port isn't mistaken for it
+    private static final String IPC_ACK = "ok";
+    private static final int IPC_ACK_TIMEOUT_MS = 2000;
+    private static final long TRACKER_STARTUP_TIMEOUT_MS = 10000;
+
     private KeyBinding openTrackerKey;
-    private Process currentProcess = null;
+    private volatile Process currentProcess = null;
     private File pythonScriptFile;
     private File dataFile;
+    private File logFile;
 
     // Queue for commands to execute
     private Queue<String> pendingCommands = new LinkedList<>();
@@ -56,6 +69,7 @@ public class DungeonTrackerMod {
         // UPDATED: Look for skyblock_tracker.py instead of skyblock.py
         pythonScriptFile = new File(configDir, "skyblock_tracker.py");
         dataFile = new File(configDir, "recent_players.json");
+        logFile = new File(configDir, "tracker.log");
 
         // Extract script from JAR
         try {
@@ -86,6 +100,13 @@ public class DungeonTrackerMod {
         // UPDATED: Register new command /stopen
         ClientCommandHandler.instance.registerCommand(new CommandSTOpen());
 
+        // Don't leave the background tracker running after Minecraft exits
+        Runtime.getRuntime().addShutdownHook(new Thread(() -> {
+            if (currentProcess != null && currentProcess.isAlive()) {
+                currentProcess.destroy();
+            }
+        }, "SkyBlock Tracker Shutdown"));
+
         System.out.println("[SkyBlock Tracker] Mod initialized!");
         System.out.println("[SkyBlock Tracker] Python script location: " + pythonScriptFile.getAbsolutePath());
     }
@@ -245,59 +266,126 @@ public class DungeonTrackerMod {
 
     /**
      * Open the tracker with optional player name
+     * The tracker keeps running in the background, so names are handed to it over
+     * a localhost socket instead of starting a new Python process every time
      */
     public void openTracker(String playerName) {
+        if (!pythonScriptFile.exists()) {
+            Minecraft.getMinecraft().thePlayer.addChatMessage(
+                    new ChatComponentText("§c[SkyBlock Tracker] Error: Python script not found!")
+            );
+            System.err.println("[SkyBlock Tracker] Script not found at: " + pythonScriptFile.getAbsolutePath());
+            return;
+        }
+
+        final String name = (playerName != null && !playerName.isEmpty()) ? playerName : null;
+
+        // Socket I/O and process startup happen off the client thread
+        Thread sender = new Thread(() -> deliverToTracker(name), "SkyBlock Tracker IPC");
+        sender.setDaemon(true);
+        sender.start();
+
+        // Show confirmation in chat
+        if (Minecraft.getMinecraft().thePlayer != null) {
+            Minecraft.getMinecraft().thePlayer.addChatMessage(
+                    new ChatComponentText("§a[SkyBlock Tracker] Opening tracker" +
+                            (name != null ? " for §b" + name : "") + "...")
+            );
+        }
+    }
+
+    /**
+     * Send the name to the running tracker, starting it first if needed
+     */
+    private synchronized void deliverToTracker(String playerName) {
+        String message = playerName != null ? "open " + playerName : "show";
+        if (sendToTracker(message)) {
+            System.out.println("[SkyBlock Tracker] Sent to running tracker: " + message);
+            return;
+        }
+
+        // Tracker may still be starting up - wait for it to start listening
+        if (currentProcess != null && currentProcess.isAlive()) {
+            long deadline = System.currentTimeMillis() + TRACKER_STARTUP_TIMEOUT_MS;
+            try {
+                while (currentProcess.isAlive() && System.currentTimeMillis() < deadline) {
+                    Thread.sleep(100);
+                    if (sendToTracker(message)) {
+                        System.out.println("[SkyBlock Tracker] Sent to running tracker: " + message);
+                        return;
+                    }
+                }
+            } catch (InterruptedException e) {
+                Thread.currentThread().interrupt();
+                return;
+            }
+        }
+
+        startTracker(playerName);
+    }
+
+    /**
+     * Write one line to the tracker's IPC socket, returns false unless the tracker acknowledged it
+     */
+    private boolean sendToTracker(String message) {
+        try (Socket socket = new Socket()) {
+            socket.connect(new InetSocketAddress(IPC_HOST, IPC_PORT), IPC_CONNECT_TIMEOUT_MS);
+            socket.setSoTimeout(IPC_ACK_TIMEOUT_MS);
+            Writer out = new OutputStreamWriter(socket.getOutputStream(), StandardCharsets.UTF_8);
+            out.write(message + "\n");
+            out.flush();
+            BufferedReader in = new BufferedReader(new InputStreamReader(socket.getInputStream(), StandardCharsets.UTF_8));
+            String reply = in.readLine();
+            return reply != null && IPC_ACK.equals(reply.trim());
+        } catch (IOException e) {
+            return false;
+        }
+    }
+
+    /**
+     * Start a new background tracker process
+     */
+    private void startTracker(String playerName) {
         try {
-            // Close existing process if any
+            // Close existing process if any (e.g. it never started listening)
             if (currentProcess != null && currentProcess.isAlive()) {
                 currentProcess.destroy();
                 Thread.sleep(100);
             }
 
-            if (!pythonScriptFile.exists()) {
-                Minecraft.getMinecraft().thePlayer.addChatMessage(
-                        new ChatComponentText("§c[SkyBlock Tracker] Error: Python script not found!")
-                );
-                System.err.println("[SkyBlock Tracker] Script not found at: " + pythonScriptFile.getAbsolutePath());
-                return;
-            }
-
             // Build command
             ProcessBuilder pb;
-            if (playerName != null && !playerName.isEmpty()) {
-                pb = new ProcessBuilder("python", pythonScriptFile.getAbsolutePath(), playerName);
+            if (playerName != null) {
+                pb = new ProcessBuilder("python", pythonScriptFile.getAbsolutePath(), playerName, "--daemon");
             } else {
-                pb = new ProcessBuilder("python", pythonScriptFile.getAbsolutePath());
+                pb = new ProcessBuilder("python", pythonScriptFile.getAbsolutePath(), "--daemon");
             }
 
             // Set working directory to config folder
             pb.directory(pythonScriptFile.getParentFile());
             pb.redirectErrorStream(true);
+            // The tracker outlives this call, so its output goes to a log instead of an unread pipe
+            pb.redirectOutput(ProcessBuilder.Redirect.appendTo(logFile));
 
             // Start process
             currentProcess = pb.start();
 
-            System.out.println("[SkyBlock Tracker] Opened tracker" +
+            System.out.println("[SkyBlock Tracker] Started tracker" +
                     (playerName != null ? " for player: " + playerName : ""));
 
-            // Show confirmation in chat
-            if (Minecraft.getMinecraft().thePlayer != null) {
-                Minecraft.getMinecraft().thePlayer.addChatMessage(
-                        new ChatComponentText("§a[SkyBlock Tracker] Opening tracker" +
-                                (playerName != null ? " for §b" + playerName : "") + "...")
-                );
-            }
-
         } catch (IOException e) {
             e.printStackTrace();
-            if (Minecraft.getMinecraft().thePlayer != null) {
-                Minecraft.getMinecraft().thePlayer.addChatMessage(
-                        new ChatComponentText("§c[SkyBlock Tracker] Error: " + e.getMessage())
-                );
-                Minecraft.getMinecraft().thePlayer.addChatMessage(
-                        new ChatComponentText("§c[SkyBlock Tracker] Make sure Python is installed and in PATH!")
-                );
-            }
+            final String error = e.getMessage();
+            Minecraft.getMinecraft().addScheduledTask(() -> {
+                if (Minecraft.getMinecraft().thePlayer != null) {
+                    Minecraft.getMinecraft().thePlayer.addChatMessage(
+                            new ChatComponentText("§c[SkyBlock Tracker] Error: " + error)
+                    );
+                    Minecraft.getMinecraft().thePlayer.addChatMessage(
+                            new ChatComponentText("§c[SkyBlock Tracker] Make sure Python is installed and in PATH!")
+                    );
+                }
+            });
         } catch (InterruptedException e) {
             e.printStackTrace();
         }
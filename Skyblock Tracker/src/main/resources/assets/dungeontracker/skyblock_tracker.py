@@ -4,29 +4,82 @@
 # Style: NEU-inspired dark theme with tabs
 
 import sys
-import requests
+import argparse
+import contextlib
+import hashlib
 import json
 import os
-from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-                             QPushButton, QComboBox, QMessageBox, QFrame, QScrollArea, QTabWidget)
-from PyQt6.QtCore import Qt, QTimer
-from collections import deque
+import socket
+import sqlite3
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from urllib.parse import unquote, urlencode, urlsplit
 
 HYPIXEL_KEY = "283cd668-95f7-4d83-8929-5e5c8aadfb2b"
 RECENT_PLAYERS_FILE = "recent_players.json"
+# Beside the script (the tracker's config directory when the mod starts it), so the window and the
+# headless modes share one cache whatever directory they are started from
+CACHE_DB_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tracker_cache.sqlite3")
+
+# Response cache lifetimes in seconds: (fresh for, still served while refreshing for)
+CACHE_TTLS = {
+    'status': (60, 10 * 60),
+    'skyblock/profiles': (10 * 60, 24 * 3600),
+    'uuid': (7 * 24 * 3600, 90 * 24 * 3600),
+    'uuid_missing': (6 * 3600, 6 * 3600),
+}
+
+# Local IPC channel the mod uses to hand names to a running tracker
+# (must match IPC_PORT in DungeonTrackerMod.java)
+IPC_HOST = "127.0.0.1"
+IPC_PORT = 47615
+IPC_CONNECT_TIMEOUT = 0.25
+# The tracker answers every message with IPC_ACK, so another program on the port isn't taken for it
+IPC_ACK = "ok"
+IPC_ACK_TIMEOUT = 2.0
+
+# Local stats server started with --serve
+SERVE_HOST = "127.0.0.1"
+SERVE_PORT = 47616
+
+# API hosts and the size of each host's keep-alive connection pool
+HYPIXEL_API = "https://api.hypixel.net/v2"
+MOJANG_API = "https://api.mojang.com"
+HTTP_POOL_SIZE = 10
+MOJANG_BATCH_SIZE = 10
+
+# Hypixel request budget until the first response reports the key's real limit
+HYPIXEL_RATE_LIMIT = 300
+HYPIXEL_RATE_WINDOW = 300
+# Share of the budget background work (prefetch, cache refresh) leaves for interactive lookups
+BACKGROUND_RESERVE = 0.25
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+USER_AGENT = "SkyBlockTracker/1.0"
+# JSON decoders in order of preference; the first one installed is used unless JSON_BACKEND names one
+JSON_BACKENDS = ('msgspec', 'orjson', 'json')
+JSON_BACKEND = None
+# Parse responses that have a streaming decoder while they download (needs ijson), so the
+# full body is never held in memory; the cache then keeps the cut-down response. msgspec's typed
+# decoder is several times faster, so with it only bodies of STREAM_DECODE_MIN_BYTES or more stream
+STREAM_DECODE = True
+STREAM_DECODE_MIN_BYTES = 16 * 1024 * 1024
 
 # XP Curves for Skills
-SKILL_XP_NORMAL = [0, 50, 175, 375, 675, 1175, 1925, 2925, 4425, 6425, 9925, 14925, 22425, 32425, 47425, 67425,
-                   97425, 147425, 222425, 322425, 522425, 822425, 1222425, 1722425, 2322425, 3022425, 3822425,
-                   4722425, 5722425, 6822425, 8022425, 9322425, 10722425, 12222425, 13822425, 15522425, 17322425,
-                   19222425, 21222425, 23322425, 25522425, 27822425, 30222425, 32722425, 35322425, 38072425,
-                   40972425, 44072425, 47472425, 51172425, 55172425, 59472425, 64072425, 68972425, 74172425,
+SKILL_XP_NORMAL = [0, 50, 175, 375, 675, 1175, 1925, 2925, 4425, 6425, 9925, 14925, 22425, 32425, 47425, 67425, 
+                   97425, 147425, 222425, 322425, 522425, 822425, 1222425, 1722425, 2322425, 3022425, 3822425, 
+                   4722425, 5722425, 6822425, 8022425, 9322425, 10722425, 12222425, 13822425, 15522425, 17322425, 
+                   19222425, 21222425, 23322425, 25522425, 27822425, 30222425, 32722425, 35322425, 38072425, 
+                   40972425, 44072425, 47472425, 51172425, 55172425, 59472425, 64072425, 68972425, 74172425, 
                    79672425, 85472425, 91572425, 97972425, 104672425, 111672425]
 
-SKILL_XP_RUNECRAFTING = [0, 50, 150, 275, 435, 635, 885, 1200, 1600, 2100, 2725, 3510, 4510, 5760, 7325, 9325,
+SKILL_XP_RUNECRAFTING = [0, 50, 150, 275, 435, 635, 885, 1200, 1600, 2100, 2725, 3510, 4510, 5760, 7325, 9325, 
                          11825, 14950, 18950, 23950, 30200, 38050, 47850, 60100, 75400]
 
-SKILL_XP_SOCIAL = [0, 50, 150, 300, 550, 1050, 1800, 2800, 4050, 5550, 7550, 10050, 13050, 16800, 21300, 27300,
+SKILL_XP_SOCIAL = [0, 50, 150, 300, 550, 1050, 1800, 2800, 4050, 5550, 7550, 10050, 13050, 16800, 21300, 27300, 
                    35300, 45300, 57800, 72800, 92800, 117800, 147800, 182800, 222800, 272800]
 
 # Slayer XP Curves
@@ -40,22 +93,29 @@ SLAYER_XP = {
 }
 
 recent_players = deque(maxlen=10)
-profiles_cache = {}
+profiles_cache = {}  # cute_name -> ProfileRecord
 current_uuid = None
 
 # Correct Dungeoneering XP table from Hypixel (CUMULATIVE - Total XP needed for each level)
 # Source: Hypixel Forums research thread
 CATACOMBS_XP = [0, 50, 125, 235, 395, 625, 955, 1425, 2095, 3045, 4385, 6275, 8940, 12700, 17960, 25340, 35640,
-                50040, 70040, 97640, 135640, 188140, 259640, 356640, 488640, 668640, 911640, 1239640, 1684640,
-                2284640, 3084640, 4149640, 5559640, 7459640, 9959640, 13259640, 17559640, 23159640, 30359640,
-                39559640, 51559640, 66559640, 85559640, 109559640, 139559640, 177559640, 225559640, 285559640,
+                50040, 70040, 97640, 135640, 188140, 259640, 356640, 488640, 668640, 911640, 1239640, 1684640, 
+                2284640, 3084640, 4149640, 5559640, 7459640, 9959640, 13259640, 17559640, 23159640, 30359640, 
+                39559640, 51559640, 66559640, 85559640, 109559640, 139559640, 177559640, 225559640, 285559640, 
                 360559640, 453559640, 569809640]
 CLASS_XP = [0, 50, 125, 235, 395, 625, 955, 1425, 2095, 3045, 4385, 6275, 8940, 12700, 17960, 25340, 35640,
-            50040, 70040, 97640, 135640, 188140, 259640, 356640, 488640, 668640, 911640, 1239640, 1684640,
-            2284640, 3084640, 4149640, 5559640, 7459640, 9959640, 13259640, 17559640, 23159640, 30359640,
-            39559640, 51559640, 66559640, 85559640, 109559640, 139559640, 177559640, 225559640, 285559640,
+            50040, 70040, 97640, 135640, 188140, 259640, 356640, 488640, 668640, 911640, 1239640, 1684640, 
+            2284640, 3084640, 4149640, 5559640, 7459640, 9959640, 13259640, 17559640, 23159640, 30359640, 
+            39559640, 51559640, 66559640, 85559640, 109559640, 139559640, 177559640, 225559640, 285559640, 
             360559640, 453559640, 569809640]
 
+# Past level 50 every Catacombs level costs the same amount of XP
+CATACOMBS_OVERFLOW_XP = 200000000
+# Batches at least this big use NumPy (if installed); smaller ones are faster in plain Python
+NUMPY_MIN_BATCH = 64
+# Panel view models kept for re-renders (three per member and profile)
+DERIVED_CACHE_SIZE = 96
+
 # ---------------- Persistent Storage ----------------
 
 def load_recent_players():
@@ -72,53 +132,619 @@ def load_recent_players():
 def save_recent_players():
     """Save recent players to file"""
     try:
-        with open(RECENT_PLAYERS_FILE, 'w') as f:
+        # Write to a temp file and swap it in so a reader never sees a half-written file
+        tmp_file = RECENT_PLAYERS_FILE + ".tmp"
+        with open(tmp_file, 'w') as f:
             json.dump(list(recent_players), f)
+        os.replace(tmp_file, RECENT_PLAYERS_FILE)
     except Exception as e:
         print(f"Error saving recent players: {e}")
 
+class ResponseCache:
+    """Raw API response bodies in SQLite, shared across runs and threads"""
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = None
+        self.lock = threading.Lock()
+
+    def _connect(self):
+        if self.conn is None:
+            self.conn = sqlite3.connect(self.path, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    endpoint TEXT NOT NULL,
+                    body TEXT NOT NULL,
+                    stored_at REAL NOT NULL
+                )
+            """)
+            # Lower-cased name -> UUID, NULL when Mojang says the name doesn't exist
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS names (
+                    name TEXT PRIMARY KEY,
+                    uuid TEXT,
+                    resolved_at REAL NOT NULL
+                )
+            """)
+            # Drop entries too old to ever be served again
+            now = time.time()
+            for endpoint, (_, max_stale) in CACHE_TTLS.items():
+                self.conn.execute("DELETE FROM responses WHERE endpoint = ? AND stored_at < ?",
+                                  (endpoint, now - max_stale))
+            self.conn.execute("DELETE FROM names WHERE uuid IS NOT NULL AND resolved_at < ?",
+                              (now - CACHE_TTLS['uuid'][1],))
+            self.conn.execute("DELETE FROM names WHERE uuid IS NULL AND resolved_at < ?",
+                              (now - CACHE_TTLS['uuid_missing'][1],))
+            self.conn.commit()
+        return self.conn
+
+    def get(self, key):
+        """Return (body, age in seconds) or None"""
+        try:
+            with self.lock:
+                row = self._connect().execute(
+                    "SELECT body, stored_at FROM responses WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error reading response cache: {e}")
+            return None
+        if row is None:
+            return None
+        body, stored_at = row
+        return body, time.time() - stored_at
+
+    def put(self, key, endpoint, body):
+        try:
+            with self.lock:
+                conn = self._connect()
+                conn.execute("INSERT OR REPLACE INTO responses (key, endpoint, body, stored_at) "
+                             "VALUES (?, ?, ?, ?)", (key, endpoint, body, time.time()))
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"Error writing response cache: {e}")
+
+    def get_name(self, name):
+        """Return (uuid or None, age in seconds) for a lower-cased name, or None if unknown"""
+        try:
+            with self.lock:
+                row = self._connect().execute(
+                    "SELECT uuid, resolved_at FROM names WHERE name = ?", (name,)).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error reading name cache: {e}")
+            return None
+        if row is None:
+            return None
+        uuid, resolved_at = row
+        return uuid, time.time() - resolved_at
+
+    def put_names(self, uuids):
+        """Store {lower-cased name: uuid or None}"""
+        now = time.time()
+        try:
+            with self.lock:
+                conn = self._connect()
+                conn.executemany("INSERT OR REPLACE INTO names (name, uuid, resolved_at) VALUES (?, ?, ?)",
+                                 [(name, uuid, now) for name, uuid in uuids.items()])
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"Error writing name cache: {e}")
+
+response_cache = ResponseCache(CACHE_DB_FILE)
+
 # ---------------- API ----------------
 
-def get_uuid(username):
-    try:
-        r = requests.get(f"https://api.mojang.com/users/profiles/minecraft/{username}", timeout=5)
-        if r.status_code != 200:
+_json_decoders = {}
+# First installed entry of JSON_BACKENDS, looked up once so missing modules aren't imported on every call
+_installed_json_backend = None
+
+def json_backend():
+    """Name of the JSON decoder in use"""
+    global _installed_json_backend
+    if JSON_BACKEND is not None:
+        return JSON_BACKEND
+    if _installed_json_backend is None:
+        for name in JSON_BACKENDS:
+            try:
+                json_decoder(name)
+            except ImportError:
+                continue
+            _installed_json_backend = name
+            break
+        else:
+            _installed_json_backend = 'json'
+    return _installed_json_backend
+
+def json_decoder(name):
+    """loads() of one backend, raising ValueError on bad input like json.loads does"""
+    decoder = _json_decoders.get(name)
+    if decoder is None:
+        if name == 'msgspec':
+            import msgspec
+
+            def decoder(body, decode=msgspec.json.Decoder().decode):
+                try:
+                    return decode(body)
+                except msgspec.DecodeError as e:
+                    raise ValueError(str(e)) from e
+        elif name == 'orjson':
+            import orjson
+            decoder = orjson.loads
+        else:
+            decoder = json.loads
+        _json_decoders[name] = decoder
+    return decoder
+
+def json_loads(body):
+    return json_decoder(json_backend())(body)
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+def get_session(base_url, headers=None):
+    """Shared keep-alive session for one API host, created on first use"""
+    with _sessions_lock:
+        session = _sessions.get(base_url)
+        if session is None:
+            # requests is imported here so handing off to a running tracker stays fast
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update({"User-Agent": USER_AGENT, "Connection": "keep-alive"})
+            session.headers.update(headers or {})
+            _sessions[base_url] = session
+        return session
+
+def close_sessions():
+    """Close all pooled connections (next request reconnects)"""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+class RateLimiter:
+    """Token bucket for the Hypixel key, kept in sync with the RateLimit-* response headers
+
+    Interactive requests may use the whole budget. Background requests only start while no
+    interactive request is waiting and more than BACKGROUND_RESERVE of the budget is left.
+    """
+
+    def __init__(self, limit=HYPIXEL_RATE_LIMIT, window=HYPIXEL_RATE_WINDOW):
+        self.limit = limit
+        self.window = window
+        self.remaining = limit
+        self.reset_at = time.monotonic() + window
+        self.in_flight = 0
+        self.interactive_waiting = 0
+        self.cond = threading.Condition()
+
+    def _roll_window(self):
+        now = time.monotonic()
+        if now >= self.reset_at:
+            self.remaining = self.limit
+            self.reset_at = now + self.window
+
+    def _may_start(self, priority):
+        if priority == PRIORITY_INTERACTIVE:
+            return self.remaining > 0
+        return self.interactive_waiting == 0 and self.remaining > self.limit * BACKGROUND_RESERVE
+
+    def acquire(self, priority=PRIORITY_INTERACTIVE):
+        """Block until a request of this priority may be sent"""
+        with self.cond:
+            interactive = priority == PRIORITY_INTERACTIVE
+            if interactive:
+                self.interactive_waiting += 1
+            try:
+                while True:
+                    self._roll_window()
+                    if self._may_start(priority):
+                        self.remaining -= 1
+                        self.in_flight += 1
+                        return
+                    self.cond.wait(timeout=max(0.05, self.reset_at - time.monotonic()))
+            finally:
+                if interactive:
+                    self.interactive_waiting -= 1
+
+    def release(self, response=None):
+        """Finish a request started with acquire(), syncing the budget with its headers"""
+        with self.cond:
+            self.in_flight -= 1
+            if response is not None:
+                try:
+                    headers = response.headers
+                    if 'RateLimit-Limit' in headers:
+                        self.limit = int(headers['RateLimit-Limit'])
+                    if 'RateLimit-Reset' in headers:
+                        self.reset_at = time.monotonic() + int(headers['RateLimit-Reset'])
+                    if response.status_code == 429:
+                        self.remaining = 0
+                        if 'RateLimit-Reset' not in headers and 'Retry-After' in headers:
+                            self.reset_at = time.monotonic() + int(headers['Retry-After'])
+                    elif 'RateLimit-Remaining' in headers:
+                        # Requests still in flight were already taken off our count
+                        self.remaining = max(0, int(headers['RateLimit-Remaining']) - self.in_flight)
+                except ValueError:
+                    pass
+            self.cond.notify_all()
+
+hypixel_limiter = RateLimiter()
+
+class SingleFlight:
+    """Lets one call per key run at a time; callers arriving meanwhile share its result"""
+
+    def __init__(self):
+        self.calls = {}
+        self.lock = threading.Lock()
+        # How many calls actually ran, and how many waited on one instead
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key, fn):
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = self.calls[key] = Future()
+                self.executed += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            return call.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        else:
+            call.set_result(result)
+        finally:
+            with self.lock:
+                del self.calls[key]
+        return result
+
+# Shared by hypixel() and get_uuid(), keyed like the response cache
+request_flight = SingleFlight()
+
+def request_stats():
+    """Counters for the single-flight layer around hypixel() and get_uuid()"""
+    return {'executed': request_flight.executed, 'coalesced': request_flight.coalesced}
+
+_refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cache-refresh")
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+def cache_key(endpoint, params):
+    return f"{endpoint}?{urlencode(sorted(params.items()))}"
+
+def refresh_in_background(key, refresh):
+    """Run refresh() for an expired entry once, without making the caller wait"""
+    with _refreshing_lock:
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+
+    def run():
+        try:
+            refresh()
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(key)
+
+    _refresh_executor.submit(run)
+
+def cached_request(endpoint, key, fetch, priority=PRIORITY_INTERACTIVE, decode=None, stale_ok=True):
+    """Decoded response for key, from the cache per CACHE_TTLS or from fetch(priority)
+
+    fetch() returns (body text, decoded data) for a response worth caching, else None.
+    Cached bodies are decoded with decode(), json_loads() by default.
+    With stale_ok=False an entry past its TTL is fetched again before answering (and None
+    returned if that fails), for callers already showing it from peek_cached().
+    """
+    def fetch_and_store(priority):
+        result = fetch(priority)
+        if result is None:
             return None
-        return r.json()["id"]
+        body, data = result
+        response_cache.put(key, endpoint, body)
+        return data
+
+    decode = decode or json_loads
+    cached = response_cache.get(key)
+    if cached is not None:
+        body, age = cached
+        ttl, max_stale = CACHE_TTLS.get(endpoint, (0, 0))
+        if age < ttl or (stale_ok and age < max_stale):
+            if age >= ttl:
+                # Stale-while-revalidate: answer now, the next call sees the refreshed entry
+                refresh_in_background(key, lambda: fetch_and_store(PRIORITY_BACKGROUND))
+            return decode(body)
+
+    # A double click, or a recent button while the same player loads, waits on the request in flight
+    return request_flight.do(key, lambda: fetch_and_store(priority))
+
+def peek_cached(endpoint, key, decode=None):
+    """(decoded response, age in seconds) for key if the cache may still serve it, else None; never requests"""
+    cached = response_cache.get(key)
+    if cached is None:
+        return None
+    body, age = cached
+    if age >= CACHE_TTLS.get(endpoint, (0, 0))[1]:
+        return None
+    return (decode or json_loads)(body), age
+
+def resolve_uuid(name):
+    """Ask Mojang about a lower-cased name and remember the answer, including unknown names"""
+    try:
+        r = get_session(MOJANG_API).get(f"{MOJANG_API}/users/profiles/minecraft/{name}", timeout=5)
     except Exception as e:
         print(f"Error getting UUID: {e}")
         return None
 
-def hypixel(endpoint, params):
+    if r.status_code in (204, 404):
+        response_cache.put_names({name: None})
+        return None
+    if r.status_code != 200:
+        # Rate limited or Mojang is having trouble; don't remember anything
+        return None
     try:
-        r = requests.get(f"https://api.hypixel.net/v2/{endpoint}",
-                         headers={"API-Key": HYPIXEL_KEY},
-                         params=params,
-                         timeout=10)
-        data = r.json()
-        if not data.get('success', False):
-            print(f"API Error: {data}")
-            return None
-        return data
+        uuid = r.json()["id"]
     except Exception as e:
-        print(f"Error calling Hypixel API: {e}")
+        print(f"Error getting UUID: {e}")
         return None
+    response_cache.put_names({name: uuid})
+    return uuid
 
-# ---------------- Logic ----------------
+def resolve_uuids(names):
+    """Ask Mojang about up to MOJANG_BATCH_SIZE lower-cased names in one request"""
+    try:
+        r = get_session(MOJANG_API).post(f"{MOJANG_API}/profiles/minecraft", json=names, timeout=5)
+        if r.status_code != 200:
+            return {}
+        found = {entry['name'].lower(): entry['id'] for entry in r.json()}
+    except Exception as e:
+        print(f"Error getting UUIDs: {e}")
+        return {}
+
+    # Names missing from the answer don't exist
+    uuids = {name: found.get(name) for name in names}
+    response_cache.put_names(uuids)
+    return uuids
+
+def cached_uuid(name):
+    """(True, uuid or None) if the name cache can answer for a lower-cased name, else (False, None)"""
+    cached = response_cache.get_name(name)
+    if cached is None:
+        return False, None
+
+    uuid, age = cached
+    if uuid is None:
+        return age < CACHE_TTLS['uuid_missing'][0], None
+
+    ttl, max_stale = CACHE_TTLS['uuid']
+    if age >= max_stale:
+        return False, None
+    if age >= ttl:
+        key = cache_key('uuid', {'name': name})
+        refresh_in_background(key, lambda: request_flight.do(key, lambda: resolve_uuid(name)))
+    return True, uuid
 
-def level_from_xp(xp, curve):
-    if xp <= 0:
-        return 0, 0.0, 0.0, curve[1] if len(curve) > 1 else 0
+def get_uuid(username):
+    name = username.lower()
+    hit, uuid = cached_uuid(name)
+    if hit:
+        return uuid
+
+    # Clicking the same name twice (or a recent button while it loads) only asks Mojang once
+    return request_flight.do(cache_key('uuid', {'name': name}), lambda: resolve_uuid(name))
+
+def get_uuids(usernames):
+    """Resolve many names at once: {username: uuid or None}
+
+    Cached names are answered locally; the rest go to Mojang MOJANG_BATCH_SIZE at a time.
+    """
+    uuids = {}
+    unresolved = []
+    for name in {username.lower() for username in usernames}:
+        hit, uuid = cached_uuid(name)
+        if hit:
+            uuids[name] = uuid
+        else:
+            unresolved.append(name)
+
+    for i in range(0, len(unresolved), MOJANG_BATCH_SIZE):
+        uuids.update(resolve_uuids(unresolved[i:i + MOJANG_BATCH_SIZE]))
+
+    return {username: uuids.get(username.lower()) for username in usernames}
+
+def response_decoder(endpoint, params):
+    """Decoder for a whole response body of endpoint: its RESPONSE_DECODERS entry, else json_loads()"""
+    decoder = RESPONSE_DECODERS.get(endpoint)
+    return (lambda body: decoder(body, params)) if decoder else json_loads
+
+def hypixel_cached(endpoint, params):
+    """(response, age in seconds) from the cache without calling the API, or None"""
+    return peek_cached(endpoint, cache_key(endpoint, params), response_decoder(endpoint, params))
+
+def hypixel(endpoint, params, priority=PRIORITY_INTERACTIVE, stale_ok=True):
+    def fetch(priority):
+        # One retry after a 429: acquire() then waits for the reported reset
+        for attempt in range(2):
+            hypixel_limiter.acquire(priority)
+            r = None
+            try:
+                r = get_session(HYPIXEL_API, {"API-Key": HYPIXEL_KEY}).get(f"{HYPIXEL_API}/{endpoint}",
+                                                                           params=params,
+                                                                           timeout=10,
+                                                                           stream=stream_decoder is not None)
+            except Exception as e:
+                print(f"Error calling Hypixel API: {e}")
+                return None
+            finally:
+                hypixel_limiter.release(r)
+
+            if r.status_code == 429 and attempt == 0:
+                r.close()
+                print(f"Rate limited on {endpoint}, waiting for the limit to reset")
+                continue
+            try:
+                if stream_decoder is not None and stream_response(r):
+                    # Parsed as it arrives; reading to the end hands the connection back to the pool
+                    r.raw.decode_content = True
+                    data = stream_decoder(r.raw, params)
+                    body = json.dumps(data)
+                else:
+                    data = decode(r.content)
+                    # Cut-down responses are cached cut down, the same as streamed ones
+                    body = json.dumps(data) if endpoint in RESPONSE_DECODERS else r.text
+            except Exception as e:
+                r.close()
+                print(f"Error calling Hypixel API: {e}")
+                return None
+            if not isinstance(data, dict) or not data.get('success', False):
+                print(f"API Error: {data}")
+                return None
+            return body, data
+        return None
 
-    for lvl in range(len(curve)-1):
-        if xp < curve[lvl+1]:
-            base = curve[lvl]
-            nxt = curve[lvl+1]
-            frac = (xp-base)/(nxt-base) if nxt > base else 0
-            return lvl, lvl+frac, frac*100, nxt-xp
+    # Some endpoints only keep part of the response, e.g. one member of each profile,
+    # and are cached in that cut-down form
+    stream_decoder = response_stream_decoder(endpoint)
+    decode = response_decoder(endpoint, params)
+    return cached_request(endpoint, cache_key(endpoint, params), fetch, priority, decode, stale_ok)
 
-    max_lvl = len(curve)-1
-    return max_lvl, float(max_lvl), 100.0, 0
+# ---------------- Logic ----------------
+
+class LevelCurve:
+    """Cumulative XP table with its per-level costs precomputed for bisect lookups
+
+    With overflow_xp set, levels keep going past the end of the table at that many XP each.
+    """
+
+    def __init__(self, thresholds, overflow_xp=0):
+        self.thresholds = list(thresholds)
+        self.deltas = [nxt - base for base, nxt in zip(self.thresholds, self.thresholds[1:])]
+        self.max_level = len(self.thresholds) - 1
+        self.max_xp = self.thresholds[-1]
+        self.overflow_xp = overflow_xp
+        self.first_level_xp = self.thresholds[1] if len(self.thresholds) > 1 else 0
+
+    def level(self, xp):
+        """Return (level, exact level, percent to next level, XP to next level)"""
+        if xp <= 0:
+            return 0, 0.0, 0.0, self.first_level_xp
+
+        if xp >= self.max_xp:
+            if not self.overflow_xp:
+                return self.max_level, float(self.max_level), 100.0, 0
+            extra_levels, into_level = divmod(xp - self.max_xp, self.overflow_xp)
+            lvl = self.max_level + int(extra_levels)
+            frac = into_level / self.overflow_xp
+            return lvl, lvl + frac, frac * 100, self.overflow_xp - into_level
+
+        lvl = bisect_right(self.thresholds, xp) - 1
+        delta = self.deltas[lvl]
+        frac = (xp - self.thresholds[lvl]) / delta if delta > 0 else 0
+        return lvl, lvl + frac, frac * 100, self.thresholds[lvl + 1] - xp
+
+    def levels(self, xps):
+        """level() for many XP values at once: lists of (levels, exact levels, percents, XP to next)"""
+        if len(xps) >= NUMPY_MIN_BATCH:
+            try:
+                import numpy
+            except ImportError:
+                pass
+            else:
+                return self._levels_numpy(numpy, xps)
+
+        results = [self.level(xp) for xp in xps]
+        if not results:
+            return [], [], [], []
+        return tuple(list(column) for column in zip(*results))
+
+    def _levels_numpy(self, np, xps):
+        xs = np.asarray(xps, dtype=float)
+        thresholds = np.asarray(self.thresholds, dtype=float)
+        deltas = np.asarray(self.deltas, dtype=float)
+
+        # Inside the table
+        idx = np.clip(np.searchsorted(thresholds, xs, side='right') - 1, 0, self.max_level - 1)
+        delta = deltas[idx]
+        frac = np.where(delta > 0, (xs - thresholds[idx]) / np.where(delta > 0, delta, 1), 0.0)
+        lvl = idx
+        exact = idx + frac
+        percent = frac * 100
+        to_next = thresholds[idx + 1] - xs
+
+        # At or past the end of the table
+        top = xs >= self.max_xp
+        if self.overflow_xp:
+            extra_levels, into_level = np.divmod(xs - self.max_xp, self.overflow_xp)
+            top_frac = into_level / self.overflow_xp
+            lvl = np.where(top, self.max_level + extra_levels.astype(int), lvl)
+            exact = np.where(top, self.max_level + extra_levels + top_frac, exact)
+            percent = np.where(top, top_frac * 100, percent)
+            to_next = np.where(top, self.overflow_xp - into_level, to_next)
+        else:
+            lvl = np.where(top, self.max_level, lvl)
+            exact = np.where(top, float(self.max_level), exact)
+            percent = np.where(top, 100.0, percent)
+            to_next = np.where(top, 0.0, to_next)
+
+        # No XP yet
+        empty = xs <= 0
+        lvl = np.where(empty, 0, lvl)
+        exact = np.where(empty, 0.0, exact)
+        percent = np.where(empty, 0.0, percent)
+        to_next = np.where(empty, self.first_level_xp, to_next)
+
+        return lvl.tolist(), exact.tolist(), percent.tolist(), to_next.tolist()
+
+def levels_by_curve(xp_by_name, curve_for):
+    """{name: level() tuple}, with one LevelCurve.levels() call per distinct curve"""
+    groups = {}
+    for name, xp in xp_by_name.items():
+        names, xps = groups.setdefault(curve_for(name), ([], []))
+        names.append(name)
+        xps.append(xp)
+
+    results = {}
+    for curve, (names, xps) in groups.items():
+        results.update(zip(names, zip(*curve.levels(xps))))
+    return results
+
+SKILL_CURVE = LevelCurve(SKILL_XP_NORMAL)
+# Skills that don't use the normal table
+SKILL_CURVES = {
+    'runecrafting': LevelCurve(SKILL_XP_RUNECRAFTING),
+    'social': LevelCurve(SKILL_XP_SOCIAL),
+}
+# Slayers with identical tables share a curve, so they are computed in one batch
+_slayer_curves_by_table = {}
+SLAYER_CURVES = {slayer: _slayer_curves_by_table.setdefault(tuple(xp_table), LevelCurve(xp_table))
+                 for slayer, xp_table in SLAYER_XP.items()}
+CATACOMBS_CURVE = LevelCurve(CATACOMBS_XP, overflow_xp=CATACOMBS_OVERFLOW_XP)
+CLASS_CURVE = LevelCurve(CLASS_XP)
+
+def online_status_text(status_data):
+    """Badge text for a 'status' API response"""
+    if status_data and 'session' in status_data:
+        is_online = status_data['session'].get('online', False)
+        return "🟢 ONLINE" if is_online else "⚫ OFFLINE"
+    return "❓ Status unknown"
+
+def format_age(seconds):
+    """Short age like 45s, 12m, 3h or 2d"""
+    for unit, size in (('d', 86400), ('h', 3600), ('m', 60)):
+        if seconds >= size:
+            return f"{int(seconds // size)}{unit}"
+    return f"{int(seconds)}s"
 
 def format_time(milliseconds):
     """Convert milliseconds to MM:SS format"""
@@ -129,18 +755,1185 @@ def format_time(milliseconds):
     secs = int(seconds % 60)
     return f"{mins:02d}:{secs:02d}"
 
+# ---------------- Profile Records ----------------
+
+SKILL_LIST = ['farming', 'mining', 'combat', 'foraging', 'fishing', 'enchanting',
+              'alchemy', 'taming', 'carpentry', 'runecrafting', 'social']
+SLAYER_LIST = ['zombie', 'spider', 'wolf', 'enderman', 'blaze', 'vampire']
+CLASS_LIST = ['healer', 'tank', 'mage', 'berserk', 'archer']
+# (name, dungeon type, tier) for E, F1-F7 and M1-M7; Master Catacombs is a separate dungeon type
+FLOOR_LIST = ([("E" if i == 0 else f"F{i}", 'catacombs', str(i)) for i in range(8)] +
+              [(f"M{i}", 'master_catacombs', str(i)) for i in range(1, 8)])
+
+_MISSING = object()
+
+class FieldSchema:
+    """Record fields declared as dotted paths into a JSON object, all read in one traversal
+
+    Each field is (target, path, default) or (target, path, default, convert):
+    - target is a record attribute, or "attribute.key" to collect fields into a dict
+    - path is a dotted path, or a tuple of paths tried in order until one isn't the default
+    - convert, if given, is applied to a value that was found
+    """
+
+    def __init__(self, fields):
+        self.fields = []
+        # Every path ends in one leaf; paths sharing a prefix share the walk down to it
+        trie = {}
+        leaf = 0
+        for target, paths, default, *convert in fields:
+            paths = (paths,) if isinstance(paths, str) else paths
+            leaves = []
+            for path in paths:
+                children = trie
+                for part in path.split('.'):
+                    entry = children.setdefault(part, ([], {}))
+                    children = entry[1]
+                entry[0].append(leaf)
+                leaves.append(leaf)
+                leaf += 1
+            self.fields.append((target, paths, leaves, default, convert[0] if convert else None))
+        self.slots = tuple(dict.fromkeys(target.split('.', 1)[0] for target, *_ in self.fields))
+        self.trie = trie
+        self.extract = self._compile(trie, leaf)
+
+    def _compile(self, trie, leaf_count):
+        """Generate extract(data) -> {attribute: value}, one nested block per trie node"""
+        namespace = {'_M': _MISSING}
+        lines = ["def extract(data):"]
+        lines += [f"    l{leaf} = _M" for leaf in range(leaf_count)]
+
+        nodes = 0
+        def walk(children, parent, indent):
+            nonlocal nodes
+            for key, (leaves, grandchildren) in children.items():
+                var = f"v{nodes}"
+                nodes += 1
+                lines.append(f"{indent}{var} = {parent}.get({key!r}, _M)")
+                lines.extend(f"{indent}l{leaf} = {var}" for leaf in leaves)
+                if grandchildren:
+                    lines.append(f"{indent}if type({var}) is dict:")
+                    walk(grandchildren, var, indent + "    ")
+        lines.append("    if type(data) is dict:")
+        walk(trie, "data", "        ")
+
+        groups = {}
+        for index, (target, _, leaves, default, convert) in enumerate(self.fields):
+            namespace[f"d{index}"] = default
+            namespace[f"c{index}"] = convert
+            # Fall through the paths until one holds something other than the default
+            value = f"d{index}"
+            for leaf in reversed(leaves):
+                found = f"l{leaf}" if convert is None else f"c{index}(l{leaf})"
+                value = f"({found} if l{leaf} is not _M and l{leaf} != d{index} else {value})"
+            group, _, key = target.partition('.')
+            groups.setdefault(group, []).append((key, value))
+
+        entries = []
+        for group, values in groups.items():
+            if values[0][0]:
+                values = ", ".join(f"{key!r}: {value}" for key, value in values)
+                entries.append(f"{group!r}: {{{values}}}")
+            else:
+                entries.append(f"{group!r}: {values[0][1]}")
+        lines.append(f"    return {{{', '.join(entries)}}}")
+
+        exec("\n".join(lines), namespace)
+        return namespace['extract']
+
+    def struct_type(self, name, extra_fields=()):
+        """msgspec Struct that decodes the schema's paths and skips everything else
+
+        Absent keys are left out again by msgspec.to_builtins(), so extract() sees the same dict shape.
+        """
+        import msgspec
+        from typing import Any, Optional
+
+        def build(children, name, extra_fields=()):
+            fields = list(extra_fields)
+            for index, (key, (leaves, grandchildren)) in enumerate(children.items()):
+                # A path that ends here needs the whole value
+                if grandchildren and not leaves:
+                    field_type = Optional[build(grandchildren, f"{name}_{index}")]
+                else:
+                    field_type = Any
+                fields.append((f"f{index}", field_type, msgspec.field(default=None, name=key)))
+            return msgspec.defstruct(name, fields, omit_defaults=True)
+
+        return build(self.trie, name, extra_fields)
+
+def active_pet(pets):
+    """(type, tier, exp) of the active pet in a pets list, or None"""
+    for pet in pets:
+        if pet.get('active', False):
+            return pet.get('type', 'Unknown'), pet.get('tier', 'COMMON'), pet.get('exp', 0)
+    return None
+
+# Everything the panels read from a profile member; add a line here to give a panel a new field
+MEMBER_SCHEMA = FieldSchema([
+    ('last_save', ('last_save', 'profile.last_save'), None),
+    ('catacombs_xp', 'dungeons.dungeon_types.catacombs.experience', 0),
+    ('secrets', 'dungeons.secrets', 0),
+    ('magical_power', 'accessory_bag_storage.highest_magical_power', 0),
+    *[(f'class_xp.{cls}', f'dungeons.player_classes.{cls}.experience', 0) for cls in CLASS_LIST],
+    *[(f'floor_runs.{name}', f'dungeons.dungeon_types.{dungeon_type}.tier_completions.{tier}', 0)
+      for name, dungeon_type, tier in FLOOR_LIST],
+    *[(f'floor_best.{name}', f'dungeons.dungeon_types.{dungeon_type}.best_score.{tier}', 0)
+      for name, dungeon_type, tier in FLOOR_LIST],
+    *[(f'floor_fastest.{name}', f'dungeons.dungeon_types.{dungeon_type}.fastest_time_s_plus.{tier}', 0)
+      for name, dungeon_type, tier in FLOOR_LIST],
+    *[(f'skill_xp.{skill}', f'player_data.experience.SKILL_{skill.upper()}', 0) for skill in SKILL_LIST],
+    *[(f'slayer_xp.{slayer}', f'slayer.slayer_bosses.{slayer}.xp', 0) for slayer in SLAYER_LIST],
+    ('skyblock_xp', 'leveling.experience', 0),
+    ('pet', 'pets_data.pets', None, active_pet),
+    # Try different possible keys for purse/coins
+    ('purse', ('currencies.coin_purse', 'coin_purse', 'currencies.coins'), 0),
+])
+
+PROFILE_SCHEMA = FieldSchema([
+    ('profile_id', 'profile_id', None),
+    ('cute_name', 'cute_name', 'Unknown'),
+    ('game_mode', 'game_mode', 'normal'),
+    ('selected', 'selected', False),
+    ('bank', 'banking.balance', 0),
+])
+
+class MemberRecord:
+    """The parts of one profile member the panels show"""
+    __slots__ = MEMBER_SCHEMA.slots
+
+    def __init__(self, member):
+        for name, value in MEMBER_SCHEMA.extract(member).items():
+            setattr(self, name, value)
+
+    def values(self):
+        return [getattr(self, slot) for slot in self.__slots__]
+
+class ProfileRecord:
+    """One SkyBlock profile reduced to what the panels show for the looked-up player"""
+    __slots__ = PROFILE_SCHEMA.slots + ('member_uuid', 'member')
+
+    def __init__(self, profile, member_uuid):
+        for name, value in PROFILE_SCHEMA.extract(profile).items():
+            setattr(self, name, value)
+        self.member_uuid = member_uuid
+        # Other coop members are dropped; None if the player isn't in this profile
+        member = profile.get('members', {}).get(member_uuid)
+        self.member = MemberRecord(member) if member is not None else None
+
+def profile_records(profiles_data, member_uuid):
+    """ProfileRecords of a 'skyblock/profiles' response, or None if it has no profile list"""
+    if not profiles_data or 'profiles' not in profiles_data:
+        return None
+    return [ProfileRecord(profile, member_uuid) for profile in profiles_data['profiles'] or [] if profile is not None]
+
+_typed_profiles_decoder = None
+
+def typed_profiles_decoder():
+    """decode(body, uuid) that builds objects only for one member's schema fields, using msgspec
+
+    Returns None instead when the response doesn't have the expected shape.
+    """
+    global _typed_profiles_decoder
+    if _typed_profiles_decoder is None:
+        import msgspec
+        from typing import Any, Optional, Union
+
+        member_decoder = msgspec.json.Decoder(MEMBER_SCHEMA.struct_type('MemberFields'))
+        # Members are kept as undecoded JSON until the looked-up one is picked out
+        profile_type = PROFILE_SCHEMA.struct_type('ProfileFields', [
+            ('members', dict[str, msgspec.Raw], msgspec.field(default_factory=dict))])
+        # UNSET tells a missing key from null, so the result has the keys json.loads() would give
+        response_decoder = msgspec.json.Decoder(msgspec.defstruct('ProfilesResponse', [
+            ('success', Any, msgspec.UNSET),
+            ('cause', Any, msgspec.UNSET),
+            ('profiles', Union[Optional[list[Optional[profile_type]]], msgspec.UnsetType], msgspec.UNSET),
+        ]))
+
+        def decode(body, uuid):
+            try:
+                response = response_decoder.decode(body)
+                profiles = response.profiles
+                if profiles:
+                    profiles = []
+                    for profile in response.profiles:
+                        if profile is None:
+                            continue
+                        member = profile.members.get(uuid)
+                        profile.members = {}
+                        fields = msgspec.to_builtins(profile)
+                        if member is not None:
+                            fields['members'] = {uuid: msgspec.to_builtins(member_decoder.decode(member))}
+                        profiles.append(fields)
+            except msgspec.ValidationError:
+                return None
+            except msgspec.DecodeError as e:
+                raise ValueError(str(e)) from e
+            data = {'success': response.success, 'cause': response.cause, 'profiles': profiles}
+            return {key: value for key, value in data.items() if value is not msgspec.UNSET}
+
+        _typed_profiles_decoder = decode
+    return _typed_profiles_decoder
+
+def decode_profiles(body, params):
+    """A 'skyblock/profiles' response with only the looked-up member (params['uuid']) left in each profile"""
+    uuid = params.get('uuid')
+    if json_backend() == 'msgspec':
+        data = typed_profiles_decoder()(body, uuid)
+        if data is not None:
+            return data
+
+    data = json_loads(body)
+    if isinstance(data, dict):
+        for profile in data.get('profiles') or []:
+            if profile and isinstance(profile.get('members'), dict):
+                member = profile['members'].get(uuid)
+                profile['members'] = {uuid: member} if member is not None else {}
+    return data
+
+# Endpoints whose responses are cut down while decoding: {endpoint: decode(body, params)}
+RESPONSE_DECODERS = {
+    'skyblock/profiles': decode_profiles,
+}
+
+def stream_profiles(stream, params):
+    """decode_profiles() for a file-like body, read incrementally with ijson
+
+    Only the kept parts (the looked-up member and the profile fields in PROFILE_SCHEMA) are
+    built as objects, so memory follows one member's size rather than the whole coop's.
+    """
+    import ijson
+
+    uuid = params.get('uuid')
+    # Where each kept value goes, by its ijson prefix
+    targets = {'success': 'response', 'cause': 'response', 'profiles': 'response',
+               f'profiles.item.members.{uuid}': 'member'}
+    targets.update((f'profiles.item.{key}', 'profile') for key in PROFILE_SCHEMA.trie)
+
+    response = {}
+    profile = None
+    builder = None
+    built = None
+    try:
+        for prefix, event, value in ijson.parse(stream, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix != built or event not in ('end_map', 'end_array'):
+                    continue
+                value = builder.value
+                builder = None
+            elif prefix == 'profiles.item':
+                if event == 'start_map':
+                    profile = {'members': {}}
+                elif event == 'end_map':
+                    response['profiles'].append(profile)
+                continue
+            elif prefix not in targets or event in ('map_key', 'end_map', 'end_array'):
+                continue
+            elif event in ('start_map', 'start_array'):
+                if prefix == 'profiles':
+                    response['profiles'] = []
+                else:
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    built = prefix
+                continue
+
+            # A kept value is complete
+            target = targets[prefix]
+            if target == 'response':
+                response[prefix] = value
+            elif target == 'profile':
+                profile[prefix.rsplit('.', 1)[1]] = value
+            else:
+                profile['members'][uuid] = value
+    except ijson.JSONError as e:
+        raise ValueError(str(e)) from e
+    return response
+
+def response_stream_decoder(endpoint):
+    """decode(stream, params) for endpoints that can be parsed while they download, else None"""
+    if not STREAM_DECODE or endpoint not in RESPONSE_STREAM_DECODERS:
+        return None
+    try:
+        import ijson
+    except ImportError:
+        return None
+    return RESPONSE_STREAM_DECODERS[endpoint]
+
+def stream_response(r):
+    """Whether a response with a stream decoder is parsed while it downloads rather than whole"""
+    if json_backend() != 'msgspec':
+        return True
+    try:
+        # Compressed size when gzipped; unknown for chunked responses
+        return int(r.headers.get('Content-Length', 0)) >= STREAM_DECODE_MIN_BYTES
+    except ValueError:
+        return False
+
+# The same, for a response still downloading: {endpoint: decode(stream, params)}
+RESPONSE_STREAM_DECODERS = {
+    'skyblock/profiles': stream_profiles,
+}
+
+# ---------------- Derived Stats ----------------
+
+SKILL_ICONS = {
+    'farming': '🌾', 'mining': '⛏️', 'combat': '⚔️', 'foraging': '🌲',
+    'fishing': '🎣', 'enchanting': '📖', 'alchemy': '⚗️', 'taming': '🐺',
+    'carpentry': '🪓', 'runecrafting': '🔮', 'social': '👥'
+}
+SLAYER_ICONS = {
+    'zombie': '🧟', 'spider': '🕷️', 'wolf': '🐺',
+    'enderman': '👾', 'blaze': '🔥', 'vampire': '🧛'
+}
+CLASS_ICONS = {'healer': '❤️', 'tank': '🛡️', 'mage': '🔮', 'berserk': '⚔️', 'archer': '🏹'}
+PET_TIER_ICONS = {
+    'COMMON': '⚪',
+    'UNCOMMON': '🟢',
+    'RARE': '🔵',
+    'EPIC': '🟣',
+    'LEGENDARY': '🟠',
+    'MYTHIC': '🔴'
+}
+GAME_MODE_NAMES = {
+    'normal': 'Normal',
+    'ironman': '⚔️ Ironman',
+    'stranded': '🏝️ Stranded',
+    'bingo': '🎯 Bingo'
+}
+
+class LRUCache:
+    """Dict with a size limit that forgets the least recently used entry first"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key, default=None):
+        with self.lock:
+            if key not in self.entries:
+                return default
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+derived_cache = LRUCache(DERIVED_CACHE_SIZE)
+
+def level_stats(xp, level):
+    """Numbers behind one level() tuple"""
+    lvl, exact, percent, needed = level
+    return {'xp': xp, 'level': int(lvl), 'exact': exact, 'percent': percent, 'to_next': needed}
+
+def derive_dungeon_stats(profile):
+    """Catacombs level, secrets, magical power, classes and the floor table"""
+    member = profile.member
+    catacombs = level_stats(member.catacombs_xp, CATACOMBS_CURVE.level(member.catacombs_xp))
+    bar_length = int(catacombs['percent'] / 5)
+    progress_bar = "█" * bar_length + "░" * (20 - bar_length)
+    cata_text = f"Level: {catacombs['exact']:.2f}\n\n"
+    cata_text += f"{progress_bar} {catacombs['percent']:.1f}%\n\n"
+    cata_text += f"Until next: {int(catacombs['to_next']):,} XP"
+
+    class_xps = [member.class_xp[cls] for cls in CLASS_LIST]
+    classes = {cls: level_stats(xp, level)
+               for cls, xp, level in zip(CLASS_LIST, class_xps, zip(*CLASS_CURVE.levels(class_xps)))}
+    class_text = ""
+    for cls in CLASS_LIST:
+        icon = CLASS_ICONS.get(cls, '•')
+        class_text += f"{icon} {cls.capitalize():<10} {int(classes[cls]['exact']):>3}\n"
+
+    floors = {name: {'runs': int(member.floor_runs[name]), 'best_score': int(member.floor_best[name]),
+                     'fastest_s_plus': member.floor_fastest[name]}
+              for name, _, _ in FLOOR_LIST}
+    floors_text = f"{'FLOOR':<8} {'RUNS':>8} {'BEST':>8} {'S+ TIME':>10}\n"
+    floors_text += "─" * 38 + "\n"
+    for i in range(8):
+        floor_name = "E" if i == 0 else f"F{i}"
+        floor = floors[floor_name]
+        icon = '🔰' if i == 0 else '⚔️'
+        floors_text += (f"{icon} {floor_name:<6} {floor['runs']:>8} {floor['best_score']:>8} "
+                        f"{format_time(floor['fastest_s_plus']):>10}\n")
+    floors_text += "\n" + "─" * 38 + "\n"
+    floors_text += f"{'MASTER':<8} {'RUNS':>8} {'BEST':>8} {'S+ TIME':>10}\n"
+    floors_text += "─" * 38 + "\n"
+    for i in range(1, 8):
+        floor = floors[f"M{i}"]
+        floors_text += (f"🔥 M{i:<6} {floor['runs']:>8} {floor['best_score']:>8} "
+                        f"{format_time(floor['fastest_s_plus']):>10}\n")
+
+    return {
+        'stats': {'catacombs': catacombs, 'secrets': member.secrets, 'magical_power': member.magical_power,
+                  'classes': classes, 'floors': floors},
+        'text': {'catacombs': cata_text,
+                 'secrets': f"🔍 Secrets: {member.secrets:,}",
+                 'magical_power': f"✨ Magical Power: {member.magical_power}\n",
+                 'classes': class_text or "No class data",
+                 'floors': floors_text},
+    }
+
+def derive_skills_slayers(profile):
+    """Skill and slayer levels with their card texts"""
+    member = profile.member
+    skill_levels = levels_by_curve(member.skill_xp, lambda skill: SKILL_CURVES.get(skill, SKILL_CURVE))
+    skills = {skill: level_stats(member.skill_xp[skill], skill_levels[skill]) for skill in SKILL_LIST}
+
+    slayer_xps = {slayer: xp for slayer, xp in member.slayer_xp.items() if slayer in SLAYER_CURVES}
+    slayer_levels = levels_by_curve(slayer_xps, SLAYER_CURVES.get)
+    slayers = {slayer: level_stats(slayer_xps[slayer], slayer_levels[slayer]) for slayer in slayer_xps}
+
+    skill_texts = {}
+    for skill, stats in skills.items():
+        text = f"{SKILL_ICONS.get(skill, '📊')} {skill.capitalize()}\n"
+        text += f"Lvl: {stats['exact']:.2f}\n"
+        text += f"Prog: {stats['percent']:.1f}%\n"
+        text += f"Next: {int(stats['to_next']):,} XP"
+        skill_texts[skill] = text
+
+    slayer_texts = {}
+    for slayer, stats in slayers.items():
+        text = f"{SLAYER_ICONS.get(slayer, '⚔️')} {slayer.capitalize()}\n"
+        text += f"Lvl: {stats['level']}\n"
+        text += f"Prog: {stats['percent']:.1f}%\n"
+        text += f"Next: {int(stats['to_next']):,} XP"
+        slayer_texts[slayer] = text
+
+    return {
+        'stats': {'skills': skills, 'slayers': slayers},
+        'text': {'skills': skill_texts, 'slayers': slayer_texts},
+    }
+
+def derive_general_data(profile):
+    """SkyBlock level, active pet, purse, bank and profile info"""
+    member = profile.member
+    sb_xp = member.skyblock_xp
+    # Simplified SB level calculation (actual formula is complex)
+    sb_level = int(sb_xp / 100)  # Placeholder calculation
+
+    pet = None
+    if member.pet:
+        pet_type, tier, exp = member.pet
+        pet = {'type': pet_type, 'tier': tier, 'exp': exp}
+        pet_text = f"{PET_TIER_ICONS.get(tier, '⚪')} {tier} {pet_type.replace('_', ' ').title()}\n"
+        pet_text += f"Experience: {exp:,}"
+    else:
+        pet_text = "No pet currently active"
+
+    game_mode_display = GAME_MODE_NAMES.get(profile.game_mode, profile.game_mode.title())
+
+    return {
+        'stats': {'skyblock_xp': sb_xp, 'skyblock_level': sb_level, 'pet': pet, 'purse': member.purse,
+                  'bank': profile.bank, 'profile': profile.cute_name, 'game_mode': profile.game_mode},
+        'text': {'skyblock_level': f"Level: {sb_level}\nTotal XP: {int(sb_xp):,}",
+                 'pet': pet_text,
+                 'money': f"💵 Purse: {member.purse:,.0f} coins\n🏦 Bank: {profile.bank:,.0f} coins",
+                 'profile': f"Profile: {profile.cute_name}\nGamemode: {game_mode_display}"},
+    }
+
+PANEL_DERIVERS = {
+    'dungeons': derive_dungeon_stats,
+    'skills': derive_skills_slayers,
+    'general': derive_general_data,
+}
+
+def member_version(profile):
+    """Changes whenever anything the panels show for the profile's member changes"""
+    # The bank is shared by the whole profile, so it is part of every member's version
+    if profile.member.last_save:
+        return profile.member.last_save, profile.bank
+    shown = json.dumps(profile.member.values(), sort_keys=True)
+    return hashlib.blake2b(shown.encode('utf-8'), digest_size=16).hexdigest(), profile.bank
+
+def derived_view(panel, profile, version=None):
+    """View model of one panel, computed once per profile, member and member version"""
+    if version is None:
+        version = member_version(profile)
+    key = (panel, profile.profile_id, profile.member_uuid, version)
+    view = derived_cache.get(key)
+    if view is None:
+        view = PANEL_DERIVERS[panel](profile)
+        derived_cache.put(key, view)
+    return view
+
+# ---------------- Headless ----------------
+
+def pick_profile(profiles, profile_name=None):
+    """The profile named profile_name (any case), else the selected one, else the first; None if no match"""
+    if profile_name:
+        wanted = profile_name.lower()
+        return next((p for p in profiles if p.cute_name.lower() == wanted), None)
+    return next((p for p in profiles if p.selected), profiles[0])
+
+def profile_document(profile):
+    """The numbers behind every panel for one ProfileRecord"""
+    version = member_version(profile)
+    document = {'profile_id': profile.profile_id, 'profile': profile.cute_name,
+                'game_mode': profile.game_mode, 'selected': profile.selected}
+    for panel in PANEL_DERIVERS:
+        document[panel] = derived_view(panel, profile, version)['stats']
+    return document
+
+def player_stats(name, profile_name=None, priority=PRIORITY_INTERACTIVE, stale_ok=True):
+    """Stats document for a player, as the GUI would show it; has an 'error' key when there is none
+
+    stale_ok is passed on to hypixel(): with False, profiles past their TTL are fetched again
+    rather than answered from the cache with the refresh left for later.
+    """
+    uuid = get_uuid(name)
+    if not uuid:
+        return {'name': name, 'error': "Player not found"}
+
+    profiles = profile_records(hypixel('skyblock/profiles', {'uuid': uuid}, priority, stale_ok), uuid)
+    if profiles is None:
+        return {'name': name, 'uuid': uuid, 'error': "Could not load profiles"}
+    if not profiles:
+        return {'name': name, 'uuid': uuid, 'error': "No SkyBlock profiles found"}
+
+    document = {'name': name, 'uuid': uuid, 'profiles': [p.cute_name for p in profiles]}
+    profile = pick_profile(profiles, profile_name)
+    if profile is None:
+        document['error'] = f"No profile named {profile_name}"
+    elif profile.member is None:
+        document['error'] = "Player not found in profile"
+    else:
+        document.update(profile_document(profile))
+    return document
+
+def run_json(args):
+    """--json: print one player's stats document, exit status 1 if it has an error"""
+    # Keep stdout to the JSON itself; error messages go to stderr
+    with contextlib.redirect_stdout(sys.stderr):
+        # Nothing in the output shows a cache age, so never print profiles past their TTL
+        document = player_stats(args.json, args.profile, stale_ok=False)
+    print(json.dumps(document, indent=2, ensure_ascii=False))
+    return 1 if 'error' in document else 0
+
+def read_names(source):
+    """Player names from a file, or stdin for "-": one per line, blank lines and # comments skipped"""
+    if source == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(source, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    names = {}
+    for line in lines:
+        name = line.strip()
+        if name and not name.startswith('#'):
+            names.setdefault(name.lower(), name)
+    return list(names.values())
+
+def scan_players(names, workers=HTTP_POOL_SIZE, profile_name=None):
+    """Yield a stats document per name, each as soon as it is ready (in no particular order)
+
+    Names are resolved to UUIDs in bulk first; profiles are then fetched by `workers` threads
+    at background priority, so a window open on the same key keeps its share of the rate limit.
+    Profiles past their TTL are fetched again, so no row comes from a day-old cache entry.
+    """
+    # Fills the name cache; names a failed bulk request left out get their own lookup in player_stats()
+    get_uuids(names)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch") as pool:
+        futures = {pool.submit(player_stats, name, profile_name, PRIORITY_BACKGROUND, False): name
+                   for name in names}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                # One player going wrong doesn't end the scan
+                yield {'name': futures[future], 'error': f"Error getting stats: {e}"}
+
+def run_batch(args):
+    """--batch: print one NDJSON line of stats per player in the file (or stdin)"""
+    global HTTP_POOL_SIZE
+    try:
+        names = read_names(args.batch)
+    except OSError as e:
+        print(f"Error reading player names: {e}", file=sys.stderr)
+        return 1
+
+    workers = max(1, args.workers)
+    # Every worker gets its own keep-alive connection
+    HTTP_POOL_SIZE = max(HTTP_POOL_SIZE, workers)
+    out = sys.stdout
+    start = time.perf_counter()
+    errors = 0
+    with contextlib.redirect_stdout(sys.stderr):
+        for document in scan_players(names, workers, args.profile):
+            errors += 'error' in document
+            out.write(json.dumps(document, ensure_ascii=False) + "\n")
+            out.flush()
+    flight = request_stats()
+    print(f"Scanned {len(names)} players in {time.perf_counter() - start:.1f}s ({errors} without stats, "
+          f"{flight['executed']} requests, {flight['coalesced']} coalesced)", file=sys.stderr)
+    return 0
+
+# HTTP status for player_stats() errors other than "not found"
+STATS_ERROR_STATUS = {"Could not load profiles": 502}
+
+def stats_response(path):
+    """(HTTP status, JSON document) for GET /player/<name>, /player/<name>/profile/<profile>
+    or /stats/requests"""
+    parts = [unquote(part) for part in urlsplit(path).path.strip('/').split('/')]
+    if parts == ['stats', 'requests']:
+        return 200, request_stats()
+    if len(parts) == 2 and parts[0] == 'player':
+        name, profile_name = parts[1], None
+    elif len(parts) == 4 and parts[0] == 'player' and parts[2] == 'profile':
+        name, profile_name = parts[1], parts[3]
+    else:
+        return 404, {'error': "Unknown path, use /player/<name> or /player/<name>/profile/<profile>"}
+    if not name or (profile_name is not None and not profile_name):
+        return 404, {'error': "Missing player or profile name"}
+
+    # Responses carry no cache age, so profiles past their TTL are fetched again
+    document = player_stats(name, profile_name, stale_ok=False)
+    if 'error' in document:
+        return STATS_ERROR_STATUS.get(document['error'], 404), document
+    return 200, document
+
+def run_serve(args):
+    """--serve: answer stats requests on localhost until interrupted
+
+    All clients share this process's response cache, derived-stats cache and connection pools.
+    """
+    # http.server is imported here so other launches don't pay for it
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class StatsHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are written separately; without this a keep-alive client waits on a delayed ACK
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            try:
+                status, document = stats_response(self.path)
+            except Exception as e:
+                # Answer with the error rather than dropping the connection
+                print(f"Error serving {self.path}: {e}")
+                status, document = 500, {'error': f"Error getting stats: {e}"}
+            body = json.dumps(document, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    try:
+        server = ThreadingHTTPServer((SERVE_HOST, args.port), StatsHandler)
+    except OSError as e:
+        print(f"Could not listen on {SERVE_HOST}:{args.port}: {e}")
+        return 1
+    server.daemon_threads = True
+    print(f"Serving stats on http://{SERVE_HOST}:{server.server_address[1]}/player/<name>", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        close_sessions()
+    return 0
+
+# ---------------- Single Instance ----------------
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="SkyBlock Tracker")
+    parser.add_argument('name', nargs='?', help="player to look up on startup")
+    parser.add_argument('--daemon', action='store_true',
+                        help="keep running in the background after the window is closed")
+    parser.add_argument('--json', metavar='NAME',
+                        help="print NAME's stats as JSON and exit, without opening a window")
+    parser.add_argument('--batch', metavar='FILE',
+                        help="print stats for every player named in FILE (- for stdin) as NDJSON and exit")
+    parser.add_argument('--workers', type=int, default=HTTP_POOL_SIZE,
+                        help=f"profiles fetched at once with --batch (default {HTTP_POOL_SIZE})")
+    parser.add_argument('--profile', help="profile to report with --json or --batch, default the selected one")
+    parser.add_argument('--serve', action='store_true',
+                        help="serve stats as JSON at /player/<name>[/profile/<profile>] on localhost")
+    parser.add_argument('--port', type=int, default=SERVE_PORT, help=f"port for --serve (default {SERVE_PORT})")
+    return parser.parse_args(argv)
+
+def launch_message(args):
+    """IPC message that asks a running tracker to do what this launch would"""
+    return f"open {args.name}" if args.name else "show"
+
+def send_to_running_instance(message):
+    """Hand a message to an already running tracker, returns False if there is none"""
+    try:
+        with socket.create_connection((IPC_HOST, IPC_PORT), timeout=IPC_CONNECT_TIMEOUT) as conn:
+            conn.sendall((message + "\n").encode('utf-8'))
+            conn.settimeout(IPC_ACK_TIMEOUT)
+            reply = conn.makefile('rb').readline()
+    except OSError:
+        return False
+    return reply.decode('utf-8', errors='replace').strip() == IPC_ACK
+
+# Checked before PyQt6 is imported: headless modes never load it, and a second launch
+# exits without building a window
+if __name__ == '__main__':
+    _args = parse_args(sys.argv[1:])
+    if _args.json:
+        sys.exit(run_json(_args))
+    if _args.batch:
+        sys.exit(run_batch(_args))
+    if _args.serve:
+        sys.exit(run_serve(_args))
+    if send_to_running_instance(launch_message(_args)):
+        sys.exit(0)
+
 # ---------------- UI ----------------
 
-class SkyBlockTracker(QWidget):
+from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+                             QPushButton, QComboBox, QMessageBox, QFrame, QScrollArea, QTabWidget)
+from PyQt6.QtCore import Qt, QTimer, QObject, QThreadPool, pyqtSignal
+from PyQt6.QtNetwork import QTcpServer, QHostAddress
+
+# Card and title colours, picked per widget with the "accent" property
+ACCENT_COLORS = {
+    'blue': '#5865f2',
+    'pink': '#eb459e',
+    'gold': '#f2c94c',
+    'purple': '#a855f7',
+    'teal': '#00d4aa',
+}
+
+# The whole look in one sheet, parsed once by QApplication. Widgets pick rules by objectName
+# (and "accent"); "#name QFrame" keeps a frame's style reaching the frames inside it, and rules
+# for inner widgets come after their containers' so they win ties.
+APP_STYLESHEET = """
+    QWidget {
+        background-color: #0f0f1a;
+        color: #e0e0e0;
+        font-family: 'Segoe UI', Arial, sans-serif;
+    }
+    QLabel {
+        color: #e0e0e0;
+    }
+    QScrollBar:vertical {
+        background: #1a1a2e;
+        width: 12px;
+        border-radius: 6px;
+    }
+    QScrollBar::handle:vertical {
+        background: #3d4066;
+        border-radius: 6px;
+        min-height: 20px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background: #4a4d6d;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+    QTabWidget::pane {
+        border: 2px solid #2d3152;
+        border-radius: 8px;
+        background: #1a1a2e;
+        padding: 5px;
+    }
+    QTabBar::tab {
+        background: #22253f;
+        color: #8b9dc3;
+        padding: 12px 24px;
+        margin-right: 4px;
+        border-top-left-radius: 8px;
+        border-top-right-radius: 8px;
+        font-weight: 600;
+        font-size: 14px;
+    }
+    QTabBar::tab:selected {
+        background: #5865f2;
+        color: #ffffff;
+    }
+    QTabBar::tab:hover:!selected {
+        background: #2d3152;
+    }
+
+    /* Sidebar */
+    QFrame#sidebar, #sidebar QFrame {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #1a1a2e, stop:1 #16162a);
+        border-radius: 15px;
+        padding: 15px;
+    }
+    QLabel#sidebarTitle {
+        font-size: 13px;
+        font-weight: bold;
+        color: #8b9dc3;
+        padding: 10px;
+        letter-spacing: 1px;
+    }
+    QScrollArea#transparentScroll, #statCard QScrollArea#transparentScroll {
+        border: none;
+        background: transparent;
+    }
+    QPushButton#recentButton {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #2a2d4a, stop:1 #22253f);
+        color: #b8c5db;
+        border: 2px solid #33364d;
+        border-radius: 8px;
+        padding: 10px;
+        text-align: left;
+        font-size: 12px;
+        font-weight: 500;
+    }
+    QPushButton#recentButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #3d4066, stop:1 #32355a);
+        border: 2px solid #4a4d6d;
+    }
+    QPushButton#recentButton:pressed {
+        background: #252842;
+    }
+
+    /* Main content */
+    QFrame#content, #content QFrame {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #1a1a2e, stop:1 #16162a);
+        border-radius: 15px;
+        padding: 25px;
+    }
+    QLabel#appTitle {
+        font-size: 22px;
+        font-weight: bold;
+        color: #ffffff;
+        padding: 5px;
+        letter-spacing: 2px;
+    }
+    QFrame#searchBar, #searchBar QFrame {
+        background: #22253f;
+        border-radius: 10px;
+        padding: 10px;
+        border: 2px solid #2d3152;
+    }
+    QLineEdit#nameInput {
+        background-color: #2a2d4a;
+        color: #ffffff;
+        border: 2px solid #3d4066;
+        border-radius: 8px;
+        padding: 10px 15px;
+        font-size: 14px;
+        font-weight: 500;
+    }
+    QLineEdit#nameInput:focus {
+        border: 2px solid #5865f2;
+        background-color: #2d3152;
+    }
+    QLineEdit#nameInput::placeholder {
+        color: #6b7196;
+    }
+    QPushButton#searchButton {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #5865f2, stop:1 #4752c4);
+        color: #ffffff;
+        border: none;
+        border-radius: 8px;
+        padding: 10px 20px;
+        font-size: 14px;
+        font-weight: bold;
+        letter-spacing: 1px;
+    }
+    QPushButton#searchButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #6a75f5, stop:1 #5461d1);
+    }
+    QPushButton#searchButton:pressed {
+        background: #4752c4;
+    }
+    QPushButton#searchButton:disabled {
+        background: #3d4066;
+        color: #6b7196;
+    }
+    QFrame#profileBar, #profileBar QFrame {
+        background: #22253f;
+        border-radius: 8px;
+        padding: 8px;
+        border: 2px solid #2d3152;
+    }
+    QLabel#statusLabel {
+        font-size: 13px;
+        font-weight: 600;
+        color: #8b9dc3;
+    }
+    QLabel#profileLabel {
+        font-size: 13px;
+        font-weight: 600;
+        color: #8b9dc3;
+    }
+    QComboBox#profileCombo {
+        background-color: #2a2d4a;
+        color: #ffffff;
+        border: 2px solid #3d4066;
+        border-radius: 6px;
+        padding: 6px 12px;
+        font-size: 13px;
+        font-weight: 500;
+        min-width: 180px;
+    }
+    QComboBox#profileCombo:hover {
+        border: 2px solid #4a4d6d;
+    }
+    QComboBox#profileCombo::drop-down {
+        border: none;
+        width: 30px;
+    }
+    QComboBox#profileCombo::down-arrow {
+        image: none;
+        border-left: 5px solid transparent;
+        border-right: 5px solid transparent;
+        border-top: 6px solid #8b9dc3;
+        margin-right: 8px;
+    }
+    #profileCombo QAbstractItemView {
+        background-color: #2a2d4a;
+        color: #ffffff;
+        border: 2px solid #3d4066;
+        selection-background-color: #3d4066;
+        padding: 5px;
+    }
+
+    /* Dungeon Stats tab */
+    QFrame#statCard, #statCard QFrame {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #22253f, stop:1 #1c1e35);
+        border-radius: 12px;
+        padding: 20px;
+    }
+    QLabel#statTitle {
+        font-size: 16px;
+        font-weight: bold;
+        letter-spacing: 1px;
+        padding-bottom: 10px;
+    }
+    QLabel#cataInfo {
+        font-size: 16px;
+        font-weight: 600;
+        color: #ffffff;
+        line-height: 1.6;
+    }
+    QLabel#cataDetail {
+        font-size: 14px;
+        color: #d0d5e0;
+        margin-top: 8px;
+    }
+    QLabel#classList {
+        font-family: 'Consolas', 'Courier New', monospace;
+        font-size: 15px;
+        color: #d0d5e0;
+        line-height: 1.9;
+    }
+    QLabel#floorsTable {
+        font-family: 'Consolas', 'Courier New', monospace;
+        font-size: 15px;
+        color: #d0d5e0;
+        line-height: 1.8;
+    }
+
+    /* Skills & Slayers tab */
+    QLabel#sectionHeader {
+        font-size: 14px;
+        font-weight: bold;
+        letter-spacing: 1px;
+        padding: 5px;
+        margin-bottom: 5px;
+    }
+    QFrame#miniCard, #miniCard QFrame {
+        background: #22253f;
+        border-radius: 6px;
+        padding: 8px;
+    }
+    QLabel#miniCardText {
+        font-size: 11px;
+        font-weight: 500;
+        color: #d0d5e0;
+        line-height: 1.3;
+    }
+
+    /* General tab */
+    QFrame#infoCard, #infoCard QFrame {
+        background: #22253f;
+        border-radius: 8px;
+        padding: 12px;
+    }
+    QLabel#infoTitle {
+        font-size: 13px;
+        font-weight: bold;
+        letter-spacing: 1px;
+        padding-bottom: 6px;
+    }
+    QLabel#infoText {
+        font-size: 12px;
+        color: #d0d5e0;
+        line-height: 1.5;
+    }
+""" + "".join(f"""
+    QFrame#statCard[accent="{accent}"], #statCard[accent="{accent}"] QFrame,
+    QFrame#infoCard[accent="{accent}"], #infoCard[accent="{accent}"] QFrame {{
+        border-top: 3px solid {color};
+    }}
+    QFrame#miniCard[accent="{accent}"], #miniCard[accent="{accent}"] QFrame {{
+        border-left: 3px solid {color};
+    }}
+    QLabel#statTitle[accent="{accent}"], QLabel#sectionHeader[accent="{accent}"], QLabel#infoTitle[accent="{accent}"] {{
+        color: {color};
+    }}
+""" for accent, color in ACCENT_COLORS.items())
+
+def create_app(argv):
+    """QApplication with the tracker's stylesheet applied"""
+    app = QApplication(argv)
+    app.setStyleSheet(APP_STYLESHEET)
+    return app
+
+def styled(widget, name, accent=None):
+    """Give a widget the objectName (and accent) its APP_STYLESHEET rules select on"""
+    widget.setObjectName(name)
+    if accent is not None:
+        widget.setProperty('accent', accent)
+    return widget
+
+class ViewBinder:
+    """Remembers the text last set on each widget and skips setText() when it is unchanged
+
+    Every setText() relayouts and repaints the label, so refreshing a panel with the same stats should
+    cost nothing. updated / skipped count the calls made and saved.
+    """
     def __init__(self):
+        self.last_text = {}
+        self.updated = 0
+        self.skipped = 0
+
+    def set_text(self, widget, text):
+        if self.last_text.get(widget) == text:
+            self.skipped += 1
+            return
+        self.last_text[widget] = text
+        widget.setText(text)
+        self.updated += 1
+
+class PlayerLookup(QObject):
+    """One player search, run on pool threads and reported back through signals"""
+    resolved = pyqtSignal(object, str)                 # lookup, uuid
+    status_loaded = pyqtSignal(object, str)            # lookup, status text
+    profiles_loaded = pyqtSignal(object, object, object)  # lookup, ProfileRecords (None if unavailable),
+                                                          # age in seconds if from the cache, else None
+    failed = pyqtSignal(object, str)                   # lookup, error text
+
+    def __init__(self, name, thread_pool):
         super().__init__()
+        self.name = name
+        self.thread_pool = thread_pool
+        self.cancelled = False
+        # Filled in on the UI thread as results arrive (in either order)
+        self.status_text = None
+        self.profiles_shown = False
+        self.cached_age = None
+        self.refresh_failed = False
+
+    def cancel(self):
+        """Drop this lookup; steps still running finish but nothing is reported"""
+        self.cancelled = True
+
+    def run(self):
+        # An exception escaping a pool thread would abort the whole process
+        try:
+            self._run()
+        except Exception as e:
+            print(f"Error looking up {self.name}: {e}")
+            if not self.cancelled:
+                self.failed.emit(self, f"❌ Error: {e}")
+
+    def _run(self):
+        # Get UUID
+        uuid = get_uuid(self.name)
+        if self.cancelled:
+            return
+        if not uuid:
+            self.failed.emit(self, "❌ Player not found")
+            return
+        self.resolved.emit(self, uuid)
+
+        # Status and profiles don't depend on each other, so fetch them side by side
+        self.thread_pool.start(lambda: self.fetch_status(uuid))
+
+        # A repeat lookup shows the last known profiles at once, then replaces them once refreshed
+        params = {'uuid': uuid}
+        cached = hypixel_cached('skyblock/profiles', params)
+        if cached is not None:
+            data, age = cached
+            if self.cancelled:
+                return
+            self.profiles_loaded.emit(self, profile_records(data, uuid), age)
+            if age < CACHE_TTLS['skyblock/profiles'][0]:
+                return
+
+        # Only the slim records cross to the UI thread; the raw response is dropped here
+        profiles = profile_records(hypixel('skyblock/profiles', params, stale_ok=False), uuid)
+        if self.cancelled:
+            return
+        self.profiles_loaded.emit(self, profiles, None)
+
+    def fetch_status(self, uuid):
+        try:
+            status_data = hypixel('status', {'uuid': uuid})
+            if self.cancelled:
+                return
+            self.status_loaded.emit(self, online_status_text(status_data))
+        except Exception as e:
+            print(f"Error getting status: {e}")
+            if not self.cancelled:
+                self.failed.emit(self, f"❌ Error: {e}")
+
+class SkyBlockTracker(QWidget):
+    # (panel, tab title, builder, loader) in tab order; each tab is built the first time it is shown
+    TABS = (
+        ('dungeons', "⚔️ Dungeon Stats", 'create_dungeon_stats_tab', 'load_dungeon_stats'),
+        ('skills', "📚 Skills & Slayers", 'create_skills_slayers_tab', 'load_skills_slayers'),
+        ('general', "📊 General", 'create_general_tab', 'load_general_data'),
+    )
 
+    def __init__(self):
+        super().__init__()
+        
         # Load recent players at startup
         load_recent_players()
+        
+        # Profile on screen; tabs it has not been loaded into yet are dirty and filled when shown
+        self.shown_profile = None
+        self.shown_version = None
+        self.built_panels = set()
+        self.dirty_panels = set()
+        self.binder = ViewBinder()
+
+        # Search currently in flight (only its results are shown)
+        self.lookup = None
+        self.lookup_uuid = None
+        # Lookups are network bound, so size the pool by connections rather than CPU cores
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(HTTP_POOL_SIZE)
+
+        # Resolve the recent players' UUIDs in one batch so clicking them skips Mojang
+        if recent_players:
+            names = list(recent_players)
+            self.thread_pool.start(lambda: get_uuids(names))
 
         # Initialize UI after loading
         self.init_ui()
-
+        
         # Update recent players UI after everything is set up
         for i, btn in enumerate(self.recent_buttons):
             if i < len(recent_players):
@@ -148,7 +1941,7 @@ class SkyBlockTracker(QWidget):
                 btn.setVisible(True)
                 player_name = recent_players[i]
                 btn.clicked.connect(lambda checked, n=player_name: QTimer.singleShot(0, lambda: self.load_recent_player(n)))
-
+        
     def init_ui(self):
         self.setWindowTitle("SkyBlock Tracker")
         self.setMinimumSize(1600, 900)
@@ -157,295 +1950,108 @@ class SkyBlockTracker(QWidget):
         self.setWindowFlags(Qt.WindowType.Window | Qt.WindowType.WindowStaysOnTopHint)
         self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating, False)
 
-        # Modern Dark Theme
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #0f0f1a;
-                color: #e0e0e0;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            QLabel {
-                color: #e0e0e0;
-            }
-            QScrollBar:vertical {
-                background: #1a1a2e;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background: #3d4066;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #4a4d6d;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QTabWidget::pane {
-                border: 2px solid #2d3152;
-                border-radius: 8px;
-                background: #1a1a2e;
-                padding: 5px;
-            }
-            QTabBar::tab {
-                background: #22253f;
-                color: #8b9dc3;
-                padding: 12px 24px;
-                margin-right: 4px;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                font-weight: 600;
-                font-size: 14px;
-            }
-            QTabBar::tab:selected {
-                background: #5865f2;
-                color: #ffffff;
-            }
-            QTabBar::tab:hover:!selected {
-                background: #2d3152;
-            }
-        """)
-
         self.main_layout = QHBoxLayout(self)
         self.main_layout.setSpacing(20)
         self.main_layout.setContentsMargins(20, 20, 20, 20)
 
         # Sidebar for recent players
         self.create_sidebar()
-
+        
         # Main content area
         self.create_main_content()
 
     def create_sidebar(self):
         sidebar_container = QFrame()
-        sidebar_container.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1a1a2e, stop:1 #16162a);
-                border-radius: 15px;
-                padding: 15px;
-            }
-        """)
+        styled(sidebar_container, 'sidebar')
         sidebar_container.setFixedWidth(240)
-
+        
         self.sidebar = QVBoxLayout(sidebar_container)
         self.sidebar.setSpacing(10)
-
+        
         sidebar_title = QLabel("📜 RECENT PLAYERS")
-        sidebar_title.setStyleSheet("""
-            font-size: 13px;
-            font-weight: bold;
-            color: #8b9dc3;
-            padding: 10px;
-            letter-spacing: 1px;
-        """)
+        styled(sidebar_title, 'sidebarTitle')
         self.sidebar.addWidget(sidebar_title)
-
+        
         # Scrollable area for recent players
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
+        styled(scroll, 'transparentScroll')
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-
+        
         scroll_widget = QWidget()
         scroll_layout = QVBoxLayout(scroll_widget)
         scroll_layout.setSpacing(8)
-
+        
         self.recent_buttons = []
         for _ in range(10):
             btn = QPushButton("")
             btn.setVisible(False)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                        stop:0 #2a2d4a, stop:1 #22253f);
-                    color: #b8c5db;
-                    border: 2px solid #33364d;
-                    border-radius: 8px;
-                    padding: 10px;
-                    text-align: left;
-                    font-size: 12px;
-                    font-weight: 500;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                        stop:0 #3d4066, stop:1 #32355a);
-                    border: 2px solid #4a4d6d;
-                }
-                QPushButton:pressed {
-                    background: #252842;
-                }
-            """)
+            styled(btn, 'recentButton')
             scroll_layout.addWidget(btn)
             self.recent_buttons.append(btn)
-
+        
         scroll_layout.addStretch()
         scroll.setWidget(scroll_widget)
         self.sidebar.addWidget(scroll)
-
+        
         self.main_layout.addWidget(sidebar_container)
 
     def create_main_content(self):
         content_container = QFrame()
-        content_container.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1a1a2e, stop:1 #16162a);
-                border-radius: 15px;
-                padding: 25px;
-            }
-        """)
-
+        styled(content_container, 'content')
+        
         self.content_layout = QVBoxLayout(content_container)
         self.content_layout.setSpacing(20)
 
         # Title (SMALLER)
         title = QLabel("⚔️ SKYBLOCK TRACKER")
-        title.setStyleSheet("""
-            font-size: 22px;
-            font-weight: bold;
-            color: #ffffff;
-            padding: 5px;
-            letter-spacing: 2px;
-        """)
+        styled(title, 'appTitle')
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.content_layout.addWidget(title)
 
         # Search bar (SMALLER)
         search_frame = QFrame()
-        search_frame.setStyleSheet("""
-            QFrame {
-                background: #22253f;
-                border-radius: 10px;
-                padding: 10px;
-                border: 2px solid #2d3152;
-            }
-        """)
+        styled(search_frame, 'searchBar')
         search_layout = QHBoxLayout(search_frame)
         search_layout.setSpacing(12)
-
+        
         self.name_input = QLineEdit()
         self.name_input.setPlaceholderText("Enter Minecraft Username...")
-        self.name_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #2a2d4a;
-                color: #ffffff;
-                border: 2px solid #3d4066;
-                border-radius: 8px;
-                padding: 10px 15px;
-                font-size: 14px;
-                font-weight: 500;
-            }
-            QLineEdit:focus {
-                border: 2px solid #5865f2;
-                background-color: #2d3152;
-            }
-            QLineEdit::placeholder {
-                color: #6b7196;
-            }
-        """)
+        styled(self.name_input, 'nameInput')
         self.name_input.returnPressed.connect(self.check_player_ui)
-
+        
         self.check_btn = QPushButton("🔍 SEARCH")
         self.check_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.check_btn.setFixedWidth(140)
-        self.check_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #5865f2, stop:1 #4752c4);
-                color: #ffffff;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-size: 14px;
-                font-weight: bold;
-                letter-spacing: 1px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #6a75f5, stop:1 #5461d1);
-            }
-            QPushButton:pressed {
-                background: #4752c4;
-            }
-            QPushButton:disabled {
-                background: #3d4066;
-                color: #6b7196;
-            }
-        """)
+        styled(self.check_btn, 'searchButton')
         self.check_btn.clicked.connect(self.check_player_ui)
-
+        
         search_layout.addWidget(self.name_input)
         search_layout.addWidget(self.check_btn)
         self.content_layout.addWidget(search_frame)
 
         # Profile selector & Status in one row (SMALLER)
         profile_frame = QFrame()
-        profile_frame.setStyleSheet("""
-            QFrame {
-                background: #22253f;
-                border-radius: 8px;
-                padding: 8px;
-                border: 2px solid #2d3152;
-            }
-        """)
+        styled(profile_frame, 'profileBar')
         profile_layout = QHBoxLayout(profile_frame)
         profile_layout.setContentsMargins(8, 4, 8, 4)
-
+        
         # Status Label (left side)
         self.status_label = QLabel("")
-        self.status_label.setStyleSheet("""
-            font-size: 13px;
-            font-weight: 600;
-            color: #8b9dc3;
-        """)
+        styled(self.status_label, 'statusLabel')
         profile_layout.addWidget(self.status_label)
-
+        
         profile_layout.addStretch()
-
+        
         profile_lbl = QLabel("📊 Profile:")
-        profile_lbl.setStyleSheet("font-size: 13px; font-weight: 600; color: #8b9dc3;")
-
+        styled(profile_lbl, 'profileLabel')
+        
         self.profile_combo = QComboBox()
         self.profile_combo.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.profile_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #2a2d4a;
-                color: #ffffff;
-                border: 2px solid #3d4066;
-                border-radius: 6px;
-                padding: 6px 12px;
-                font-size: 13px;
-                font-weight: 500;
-                min-width: 180px;
-            }
-            QComboBox:hover {
-                border: 2px solid #4a4d6d;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 30px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 6px solid #8b9dc3;
-                margin-right: 8px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #2a2d4a;
-                color: #ffffff;
-                border: 2px solid #3d4066;
-                selection-background-color: #3d4066;
-                padding: 5px;
-            }
-        """)
+        styled(self.profile_combo, 'profileCombo')
         self.profile_combo.currentTextChanged.connect(self.load_profile_ui)
-
+        
         profile_layout.addWidget(profile_lbl)
         profile_layout.addWidget(self.profile_combo)
         self.content_layout.addWidget(profile_frame)
@@ -454,16 +2060,16 @@ class SkyBlockTracker(QWidget):
         self.tabs = QTabWidget()
         self.content_layout.addWidget(self.tabs)
 
-        # Create all tabs
-        self.create_dungeon_stats_tab()
-        self.create_skills_slayers_tab()
-        self.create_general_tab()
+        # Empty pages until shown; only the first tab, which the window opens on, is built now
+        for panel, tab_title, build, load in self.TABS:
+            self.tabs.addTab(QWidget(), tab_title)
+        self.tabs.currentChanged.connect(self.show_tab)
+        self.show_tab(self.tabs.currentIndex())
 
         self.main_layout.addWidget(content_container)
 
     # ============== TAB 1: DUNGEON STATS (ORIGINAL) ==============
-    def create_dungeon_stats_tab(self):
-        dungeon_tab = QWidget()
+    def create_dungeon_stats_tab(self, dungeon_tab):
         dungeon_layout = QVBoxLayout(dungeon_tab)
         dungeon_layout.setSpacing(20)
         dungeon_layout.setContentsMargins(10, 10, 10, 10)
@@ -474,85 +2080,58 @@ class SkyBlockTracker(QWidget):
         dungeon_layout.addLayout(stats_layout)
 
         # Catacombs Card
-        self.cata_frame = self.create_stat_card("🏰 CATACOMBS", "#5865f2", stats_layout)
-
+        self.cata_frame = self.create_stat_card("🏰 CATACOMBS", 'blue', stats_layout)
+        
         self.cata_info = QLabel("Level: --")
-        self.cata_info.setStyleSheet("font-size: 16px; font-weight: 600; color: #ffffff; line-height: 1.6;")
+        styled(self.cata_info, 'cataInfo')
         self.cata_secrets = QLabel("")
-        self.cata_secrets.setStyleSheet("font-size: 14px; color: #d0d5e0; margin-top: 8px;")
+        styled(self.cata_secrets, 'cataDetail')
         self.cata_magical_power = QLabel("")  # NEW: Magical Power
-        self.cata_magical_power.setStyleSheet("font-size: 14px; color: #d0d5e0; margin-top: 8px;")
-
+        styled(self.cata_magical_power, 'cataDetail')
+        
         self.cata_frame.addWidget(self.cata_info)
         self.cata_frame.addWidget(self.cata_secrets)
         self.cata_frame.addWidget(self.cata_magical_power)
         self.cata_frame.addStretch()
 
         # Classes Card
-        self.class_frame = self.create_stat_card("👥 CLASSES", "#eb459e", stats_layout)
+        self.class_frame = self.create_stat_card("👥 CLASSES", 'pink', stats_layout)
         self.class_label = QLabel("No data")
-        self.class_label.setStyleSheet("""
-            font-family: 'Consolas', 'Courier New', monospace;
-            font-size: 15px;
-            color: #d0d5e0;
-            line-height: 1.9;
-        """)
+        styled(self.class_label, 'classList')
         self.class_frame.addWidget(self.class_label)
         self.class_frame.addStretch()
 
         # Floors Card (with scroll)
         floors_container = QFrame()
-        floors_container.setStyleSheet(f"""
-            QFrame {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #22253f, stop:1 #1c1e35);
-                border-radius: 12px;
-                border-top: 3px solid #f2c94c;
-                padding: 20px;
-            }}
-        """)
-
+        styled(floors_container, 'statCard', 'gold')
+        
         floors_layout = QVBoxLayout(floors_container)
-
+        
         floors_title = QLabel("🗡️ FLOORS")
-        floors_title.setStyleSheet("""
-            font-size: 16px;
-            font-weight: bold;
-            color: #f2c94c;
-            letter-spacing: 1px;
-            padding-bottom: 10px;
-        """)
+        styled(floors_title, 'statTitle', 'gold')
         floors_layout.addWidget(floors_title)
-
+        
         # Scrollable floors area
         floors_scroll = QScrollArea()
         floors_scroll.setWidgetResizable(True)
-        floors_scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
+        styled(floors_scroll, 'transparentScroll')
         floors_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-
+        
         floors_scroll_widget = QWidget()
         floors_scroll_layout = QVBoxLayout(floors_scroll_widget)
-
+        
         self.floors_label = QLabel("No data")
-        self.floors_label.setStyleSheet("""
-            font-family: 'Consolas', 'Courier New', monospace;
-            font-size: 15px;
-            color: #d0d5e0;
-            line-height: 1.8;
-        """)
+        styled(self.floors_label, 'floorsTable')
         floors_scroll_layout.addWidget(self.floors_label)
         floors_scroll_layout.addStretch()
-
+        
         floors_scroll.setWidget(floors_scroll_widget)
         floors_layout.addWidget(floors_scroll)
-
+        
         stats_layout.addWidget(floors_container)
 
-        self.tabs.addTab(dungeon_tab, "⚔️ Dungeon Stats")
-
     # ============== TAB 2: SKILLS & SLAYERS ==============
-    def create_skills_slayers_tab(self):
-        skills_tab = QWidget()
+    def create_skills_slayers_tab(self, skills_tab):
         skills_main_layout = QVBoxLayout(skills_tab)
         skills_main_layout.setSpacing(15)
         skills_main_layout.setContentsMargins(10, 10, 10, 10)
@@ -567,22 +2146,15 @@ class SkyBlockTracker(QWidget):
         skills_container_layout = QVBoxLayout(skills_container)
         skills_container_layout.setSpacing(8)
         skills_container_layout.setContentsMargins(0, 0, 0, 0)
-
+        
         skills_header = QLabel("📚 SKILLS")
-        skills_header.setStyleSheet("""
-            font-size: 14px;
-            font-weight: bold;
-            color: #5865f2;
-            letter-spacing: 1px;
-            padding: 5px;
-            margin-bottom: 5px;
-        """)
+        styled(skills_header, 'sectionHeader', 'blue')
         skills_container_layout.addWidget(skills_header)
-
+        
         # Skills Grid Layout (3x4 grid for 11 skills)
         skills_grid = QHBoxLayout()
         skills_grid.setSpacing(8)
-
+        
         # Create 3 columns
         col1_layout = QVBoxLayout()
         col1_layout.setSpacing(8)
@@ -592,40 +2164,20 @@ class SkyBlockTracker(QWidget):
         col3_layout.setSpacing(8)
         col4_layout = QVBoxLayout()
         col4_layout.setSpacing(8)
-
+        
         self.skill_labels = {}
-        skill_list = ['farming', 'mining', 'combat', 'foraging', 'fishing', 'enchanting',
-                      'alchemy', 'taming', 'carpentry', 'runecrafting', 'social']
-        skill_icons = {
-            'farming': '🌾', 'mining': '⛏️', 'combat': '⚔️', 'foraging': '🌲',
-            'fishing': '🎣', 'enchanting': '📖', 'alchemy': '⚗️', 'taming': '🐺',
-            'carpentry': '🪓', 'runecrafting': '🔮', 'social': '👥'
-        }
-
-        for idx, skill in enumerate(skill_list):
+        for idx, skill in enumerate(SKILL_LIST):
             skill_card = QFrame()
-            skill_card.setStyleSheet("""
-                QFrame {
-                    background: #22253f;
-                    border-radius: 6px;
-                    padding: 8px;
-                    border-left: 3px solid #5865f2;
-                }
-            """)
+            styled(skill_card, 'miniCard', 'blue')
             skill_card_layout = QVBoxLayout(skill_card)
             skill_card_layout.setContentsMargins(6, 6, 6, 6)
-
-            icon = skill_icons.get(skill, '📊')
+            
+            icon = SKILL_ICONS.get(skill, '📊')
             skill_label = QLabel(f"{icon} {skill.capitalize()}\nLvl: --\nProg: --")
-            skill_label.setStyleSheet("""
-                font-size: 11px;
-                font-weight: 500;
-                color: #d0d5e0;
-                line-height: 1.3;
-            """)
+            styled(skill_label, 'miniCardText')
             self.skill_labels[skill] = skill_label
             skill_card_layout.addWidget(skill_label)
-
+            
             # Distribute across 4 columns
             if idx < 3:
                 col1_layout.addWidget(skill_card)
@@ -635,17 +2187,17 @@ class SkyBlockTracker(QWidget):
                 col3_layout.addWidget(skill_card)
             else:
                 col4_layout.addWidget(skill_card)
-
+        
         col1_layout.addStretch()
         col2_layout.addStretch()
         col3_layout.addStretch()
         col4_layout.addStretch()
-
+        
         skills_grid.addLayout(col1_layout)
         skills_grid.addLayout(col2_layout)
         skills_grid.addLayout(col3_layout)
         skills_grid.addLayout(col4_layout)
-
+        
         skills_container_layout.addLayout(skills_grid)
         columns_layout.addWidget(skills_container)
 
@@ -654,78 +2206,50 @@ class SkyBlockTracker(QWidget):
         slayers_container_layout = QVBoxLayout(slayers_container)
         slayers_container_layout.setSpacing(8)
         slayers_container_layout.setContentsMargins(0, 0, 0, 0)
-
+        
         slayers_header = QLabel("🗡️ SLAYERS")
-        slayers_header.setStyleSheet("""
-            font-size: 14px;
-            font-weight: bold;
-            color: #eb459e;
-            letter-spacing: 1px;
-            padding: 5px;
-            margin-bottom: 5px;
-        """)
+        styled(slayers_header, 'sectionHeader', 'pink')
         slayers_container_layout.addWidget(slayers_header)
-
+        
         # Slayers Grid (2 columns for 6 slayers)
         slayers_grid = QHBoxLayout()
         slayers_grid.setSpacing(8)
-
+        
         slayer_col1 = QVBoxLayout()
         slayer_col1.setSpacing(8)
         slayer_col2 = QVBoxLayout()
         slayer_col2.setSpacing(8)
-
+        
         self.slayer_labels = {}
-        slayer_list = ['zombie', 'spider', 'wolf', 'enderman', 'blaze', 'vampire']
-        slayer_icons = {
-            'zombie': '🧟', 'spider': '🕷️', 'wolf': '🐺',
-            'enderman': '👾', 'blaze': '🔥', 'vampire': '🧛'
-        }
-
-        for idx, slayer in enumerate(slayer_list):
+        for idx, slayer in enumerate(SLAYER_LIST):
             slayer_card = QFrame()
-            slayer_card.setStyleSheet("""
-                QFrame {
-                    background: #22253f;
-                    border-radius: 6px;
-                    padding: 8px;
-                    border-left: 3px solid #eb459e;
-                }
-            """)
+            styled(slayer_card, 'miniCard', 'pink')
             slayer_card_layout = QVBoxLayout(slayer_card)
             slayer_card_layout.setContentsMargins(6, 6, 6, 6)
-
-            icon = slayer_icons.get(slayer, '⚔️')
+            
+            icon = SLAYER_ICONS.get(slayer, '⚔️')
             slayer_label = QLabel(f"{icon} {slayer.capitalize()}\nLvl: --\nProg: --")
-            slayer_label.setStyleSheet("""
-                font-size: 11px;
-                font-weight: 500;
-                color: #d0d5e0;
-                line-height: 1.3;
-            """)
+            styled(slayer_label, 'miniCardText')
             self.slayer_labels[slayer] = slayer_label
             slayer_card_layout.addWidget(slayer_label)
-
+            
             # Distribute across 2 columns
             if idx < 3:
                 slayer_col1.addWidget(slayer_card)
             else:
                 slayer_col2.addWidget(slayer_card)
-
+        
         slayer_col1.addStretch()
         slayer_col2.addStretch()
-
+        
         slayers_grid.addLayout(slayer_col1)
         slayers_grid.addLayout(slayer_col2)
-
+        
         slayers_container_layout.addLayout(slayers_grid)
         columns_layout.addWidget(slayers_container)
 
-        self.tabs.addTab(skills_tab, "📚 Skills & Slayers")
-
     # ============== TAB 3: GENERAL ==============
-    def create_general_tab(self):
-        general_tab = QWidget()
+    def create_general_tab(self, general_tab):
         general_main_layout = QVBoxLayout(general_tab)
         general_main_layout.setSpacing(12)
         general_main_layout.setContentsMargins(10, 10, 10, 10)
@@ -733,178 +2257,106 @@ class SkyBlockTracker(QWidget):
         # Two columns layout
         columns = QHBoxLayout()
         columns.setSpacing(12)
-
+        
         # LEFT COLUMN
         left_column = QVBoxLayout()
         left_column.setSpacing(12)
-
+        
         # ===== SKYBLOCK LEVEL =====
         sb_level_card = QFrame()
-        sb_level_card.setStyleSheet("""
-            QFrame {
-                background: #22253f;
-                border-radius: 8px;
-                padding: 12px;
-                border-top: 3px solid #5865f2;
-            }
-        """)
+        styled(sb_level_card, 'infoCard', 'blue')
         sb_level_layout = QVBoxLayout(sb_level_card)
         sb_level_layout.setContentsMargins(10, 8, 10, 8)
-
+        
         sb_level_title = QLabel("📊 SKYBLOCK LEVEL")
-        sb_level_title.setStyleSheet("""
-            font-size: 13px;
-            font-weight: bold;
-            color: #5865f2;
-            letter-spacing: 1px;
-            padding-bottom: 6px;
-        """)
+        styled(sb_level_title, 'infoTitle', 'blue')
         sb_level_layout.addWidget(sb_level_title)
-
+        
         self.sb_level_label = QLabel("Level: --\nProgress: --")
-        self.sb_level_label.setStyleSheet("""
-            font-size: 12px;
-            color: #d0d5e0;
-            line-height: 1.5;
-        """)
+        styled(self.sb_level_label, 'infoText')
         sb_level_layout.addWidget(self.sb_level_label)
         left_column.addWidget(sb_level_card)
-
+        
         # ===== ACTIVE PET =====
         pet_card = QFrame()
-        pet_card.setStyleSheet("""
-            QFrame {
-                background: #22253f;
-                border-radius: 8px;
-                padding: 12px;
-                border-top: 3px solid #a855f7;
-            }
-        """)
+        styled(pet_card, 'infoCard', 'purple')
         pet_layout = QVBoxLayout(pet_card)
         pet_layout.setContentsMargins(10, 8, 10, 8)
-
+        
         pet_title = QLabel("🐾 ACTIVE PET")
-        pet_title.setStyleSheet("""
-            font-size: 13px;
-            font-weight: bold;
-            color: #a855f7;
-            letter-spacing: 1px;
-            padding-bottom: 6px;
-        """)
+        styled(pet_title, 'infoTitle', 'purple')
         pet_layout.addWidget(pet_title)
-
+        
         self.general_pet_label = QLabel("No pet active")
-        self.general_pet_label.setStyleSheet("""
-            font-size: 12px;
-            color: #d0d5e0;
-            line-height: 1.5;
-        """)
+        styled(self.general_pet_label, 'infoText')
         pet_layout.addWidget(self.general_pet_label)
         left_column.addWidget(pet_card)
-
+        
         left_column.addStretch()
         columns.addLayout(left_column)
-
+        
         # RIGHT COLUMN
         right_column = QVBoxLayout()
         right_column.setSpacing(12)
-
+        
         # ===== PURSE & BANK (Combined in one card) =====
         money_card = QFrame()
-        money_card.setStyleSheet("""
-            QFrame {
-                background: #22253f;
-                border-radius: 8px;
-                padding: 12px;
-                border-top: 3px solid #f2c94c;
-            }
-        """)
+        styled(money_card, 'infoCard', 'gold')
         money_layout = QVBoxLayout(money_card)
         money_layout.setContentsMargins(10, 8, 10, 8)
-
+        
         money_title = QLabel("💰 BANKING")
-        money_title.setStyleSheet("""
-            font-size: 13px;
-            font-weight: bold;
-            color: #f2c94c;
-            letter-spacing: 1px;
-            padding-bottom: 6px;
-        """)
+        styled(money_title, 'infoTitle', 'gold')
         money_layout.addWidget(money_title)
-
+        
         self.money_combined_label = QLabel("💵 Purse: --\n🏦 Bank: --")
-        self.money_combined_label.setStyleSheet("""
-            font-size: 12px;
-            color: #d0d5e0;
-            line-height: 1.5;
-        """)
+        styled(self.money_combined_label, 'infoText')
         money_layout.addWidget(self.money_combined_label)
         right_column.addWidget(money_card)
-
+        
         # ===== PROFILE INFO =====
         profile_card = QFrame()
-        profile_card.setStyleSheet("""
-            QFrame {
-                background: #22253f;
-                border-radius: 8px;
-                padding: 12px;
-                border-top: 3px solid #00d4aa;
-            }
-        """)
+        styled(profile_card, 'infoCard', 'teal')
         profile_layout = QVBoxLayout(profile_card)
         profile_layout.setContentsMargins(10, 8, 10, 8)
-
+        
         profile_title = QLabel("📋 PROFILE INFO")
-        profile_title.setStyleSheet("""
-            font-size: 13px;
-            font-weight: bold;
-            color: #00d4aa;
-            letter-spacing: 1px;
-            padding-bottom: 6px;
-        """)
+        styled(profile_title, 'infoTitle', 'teal')
         profile_layout.addWidget(profile_title)
-
+        
         self.profile_info_label = QLabel("Profile: --\nGamemode: --")
-        self.profile_info_label.setStyleSheet("""
-            font-size: 12px;
-            color: #d0d5e0;
-            line-height: 1.5;
-        """)
+        styled(self.profile_info_label, 'infoText')
         profile_layout.addWidget(self.profile_info_label)
         right_column.addWidget(profile_card)
-
+        
         right_column.addStretch()
         columns.addLayout(right_column)
-
+        
         general_main_layout.addLayout(columns)
 
-        self.tabs.addTab(general_tab, "📊 General")
-
-    def create_stat_card(self, title, accent_color, parent_layout):
+    def show_tab(self, index):
+        """Build a tab the first time it is shown and fill it if the profile changed since"""
+        if index < 0:
+            return
+        panel, tab_title, build, load = self.TABS[index]
+        if panel not in self.built_panels:
+            getattr(self, build)(self.tabs.widget(index))
+            self.built_panels.add(panel)
+        if panel in self.dirty_panels:
+            self.dirty_panels.discard(panel)
+            getattr(self, load)(derived_view(panel, self.shown_profile, self.shown_version))
+
+    def create_stat_card(self, title, accent, parent_layout):
         card = QFrame()
-        card.setStyleSheet(f"""
-            QFrame {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #22253f, stop:1 #1c1e35);
-                border-radius: 12px;
-                border-top: 3px solid {accent_color};
-                padding: 20px;
-            }}
-        """)
-
+        styled(card, 'statCard', accent)
+        
         layout = QVBoxLayout(card)
         layout.setSpacing(10)
-
+        
         title_label = QLabel(title)
-        title_label.setStyleSheet(f"""
-            font-size: 16px;
-            font-weight: bold;
-            color: {accent_color};
-            letter-spacing: 1px;
-            padding-bottom: 10px;
-        """)
+        styled(title_label, 'statTitle', accent)
         layout.addWidget(title_label)
-
+        
         parent_layout.addWidget(card)
         return layout
 
@@ -914,10 +2366,10 @@ class SkyBlockTracker(QWidget):
         if name in recent_players:
             recent_players.remove(name)
         recent_players.appendleft(name)
-
+        
         # Save to file
         save_recent_players()
-
+        
         for i, btn in enumerate(self.recent_buttons):
             if i < len(recent_players):
                 btn.setText(f"👤 {recent_players[i]}")
@@ -937,6 +2389,30 @@ class SkyBlockTracker(QWidget):
         self.name_input.setText(name)
         self.check_player_ui()
 
+    def bring_to_front(self):
+        """Show the window again (it stays alive hidden in daemon mode)"""
+        if self.isMinimized():
+            self.showNormal()
+        else:
+            self.show()
+        self.raise_()
+        self.activateWindow()
+
+    def handle_ipc_message(self, message):
+        """Handle an "open <name>" or "show" line from the mod or another launch"""
+        command, _, argument = message.partition(' ')
+        command = command.lower()
+        player_name = argument.strip()
+
+        if command not in ('open', 'show'):
+            print(f"Unknown IPC message: {message}")
+            return
+
+        self.bring_to_front()
+        if command == 'open' and player_name:
+            # Defer so the window is raised before the lookup starts
+            QTimer.singleShot(0, lambda: self.load_recent_player(player_name))
+    
     def closeEvent(self, event):
         """Save recent players when closing the app"""
         save_recent_players()
@@ -945,324 +2421,200 @@ class SkyBlockTracker(QWidget):
     def load_profile_ui(self, profile_name):
         if not profile_name or profile_name not in profiles_cache:
             return
-
+        
         profile = profiles_cache[profile_name]
-
-        if current_uuid not in profile.get('members', {}):
+        
+        if profile.member is None:
             self.status_label.setText("❌ Error: Player not found in profile")
             return
-
-        member = profile['members'][current_uuid]
-
-        # Load all sections
-        self.load_dungeon_stats(member)
-        self.load_skills_slayers(member)
-        self.load_general_data(member, profile)
+        
+        # Every tab is now out of date, but only the one on screen is filled (from the
+        # derived-stats cache when nothing changed); the others catch up when shown
+        self.shown_profile = profile
+        self.shown_version = member_version(profile)
+        self.dirty_panels = {panel for panel, tab_title, build, load in self.TABS}
+        self.show_tab(self.tabs.currentIndex())
 
     # ============== LOAD DUNGEON STATS (ORIGINAL) ==============
-    def load_dungeon_stats(self, member):
-        dungeon = member.get('dungeons', {})
-
-        # Get dungeon types
-        dungeon_types = dungeon.get('dungeon_types', {})
-
-        # Catacombs (Normal)
-        cat = dungeon_types.get('catacombs', {})
-
-        # Master Catacombs (separate dungeon type!)
-        master_cat = dungeon_types.get('master_catacombs', {})
-
-        # Catacombs Level
-        cata_xp = cat.get('experience', 0)
-        lvl, exact, percent, needed = level_from_xp(cata_xp, CATACOMBS_XP)
-
-        # Combine all catacombs info into one text block with better spacing
-        bar_length = int(percent / 5)
-        progress_bar = "█" * bar_length + "░" * (20 - bar_length)
-
-        cata_text = f"Level: {exact:.2f}\n\n"
-        cata_text += f"{progress_bar} {percent:.1f}%\n\n"
-        cata_text += f"Until next: {int(needed):,} XP"
-
-        self.cata_info.setText(cata_text)
-
-        # Secrets
-        secrets = dungeon.get('secrets', 0)
-        self.cata_secrets.setText(f"🔍 Secrets: {secrets:,}")
-
-        # Magical Power (NEW)
-        magical_power = member.get('accessory_bag_storage', {}).get('highest_magical_power', 0)
-        self.cata_magical_power.setText(f"✨ Magical Power: {magical_power}\n")
-
-        # Classes
-        classes = dungeon.get('player_classes', {})
-        class_icons = {'healer': '❤️', 'tank': '🛡️', 'mage': '🔮', 'berserk': '⚔️', 'archer': '🏹'}
-        class_text = ""
-        for cls in ['healer', 'tank', 'mage', 'berserk', 'archer']:
-            xp = classes.get(cls, {}).get('experience', 0)
-            _, ex, _, _ = level_from_xp(xp, CLASS_XP)
-            icon = class_icons.get(cls, '•')
-            class_text += f"{icon} {cls.capitalize():<10} {int(ex):>3}\n"
-        self.class_label.setText(class_text if class_text else "No class data")
-
-        # Floors - Normal and Master Mode (from separate dungeon types)
-        floors = cat.get('tier_completions', {})
-        fastest_time_s_plus = cat.get('fastest_time_s_plus', {})
-        best_score = cat.get('best_score', {})
-
-        # Master mode data from master_catacombs
-        master_completions = master_cat.get('tier_completions', {})
-        master_best_score = master_cat.get('best_score', {})
-        master_fastest_s = master_cat.get('fastest_time_s_plus', {})
-
-        # Normal Floors Header
-        floors_text = f"{'FLOOR':<8} {'RUNS':>8} {'BEST':>8} {'S+ TIME':>10}\n"
-        floors_text += "─" * 38 + "\n"
-
-        # Normal Floors (E, F1-F7)
-        for i in range(8):
-            floor_key = str(i)
-            n = floors.get(floor_key, 0)
-            score = best_score.get(floor_key, 0)
-            time_s = fastest_time_s_plus.get(floor_key, 0)
-
-            floor_name = "E" if i == 0 else f"F{i}"
-            icon = '🔰' if i == 0 else '⚔️'
-
-            floors_text += f"{icon} {floor_name:<6} {int(n):>8} {int(score):>8} {format_time(time_s):>10}\n"
-
-        # Master Mode Section
-        floors_text += "\n" + "─" * 38 + "\n"
-        floors_text += f"{'MASTER':<8} {'RUNS':>8} {'BEST':>8} {'S+ TIME':>10}\n"
-        floors_text += "─" * 38 + "\n"
-
-        # Master Floors (M1-M7, no entrance)
-        for i in range(1, 8):
-            floor_key = str(i)
-            m = master_completions.get(floor_key, 0)
-            score_m = master_best_score.get(floor_key, 0)
-            time_s_m = master_fastest_s.get(floor_key, 0)
-
-            floors_text += f"🔥 M{i:<6} {int(m):>8} {int(score_m):>8} {format_time(time_s_m):>10}\n"
-
-        self.floors_label.setText(floors_text if floors_text else "No floor data")
+    def load_dungeon_stats(self, view):
+        text = view['text']
+        set_text = self.binder.set_text
+        set_text(self.cata_info, text['catacombs'])
+        set_text(self.cata_secrets, text['secrets'])
+        set_text(self.cata_magical_power, text['magical_power'])
+        set_text(self.class_label, text['classes'])
+        set_text(self.floors_label, text['floors'])
 
     # ============== LOAD SKILLS & SLAYERS (NEW) ==============
-    def load_skills_slayers(self, member):
-        # ===== SKILLS =====
-        player_data = member.get('player_data', {})
-        experience = player_data.get('experience', {})
-
-        skill_list = ['farming', 'mining', 'combat', 'foraging', 'fishing', 'enchanting',
-                      'alchemy', 'taming', 'carpentry', 'runecrafting', 'social']
-        skill_icons = {
-            'farming': '🌾', 'mining': '⛏️', 'combat': '⚔️', 'foraging': '🌲',
-            'fishing': '🎣', 'enchanting': '📖', 'alchemy': '⚗️', 'taming': '🐺',
-            'carpentry': '🪓', 'runecrafting': '🔮', 'social': '👥'
-        }
-
-        for skill in skill_list:
-            xp_key = f'SKILL_{skill.upper()}'
-            xp = experience.get(xp_key, 0)
-
-            # Determine XP curve
-            if skill == 'runecrafting':
-                curve = SKILL_XP_RUNECRAFTING
-            elif skill == 'social':
-                curve = SKILL_XP_SOCIAL
-            else:
-                curve = SKILL_XP_NORMAL
-
-            lvl, exact, percent, needed = level_from_xp(xp, curve)
-
-            icon = skill_icons.get(skill, '📊')
-            text = f"{icon} {skill.capitalize()}\n"
-            text += f"Lvl: {exact:.2f}\n"
-            text += f"Prog: {percent:.1f}%\n"
-            text += f"Next: {int(needed):,} XP"
-
+    def load_skills_slayers(self, view):
+        text = view['text']
+        for skill, skill_text in text['skills'].items():
             if skill in self.skill_labels:
-                self.skill_labels[skill].setText(text)
-
-        # ===== SLAYERS =====
-        slayer_bosses = member.get('slayer', {}).get('slayer_bosses', {})
-        slayer_list = ['zombie', 'spider', 'wolf', 'enderman', 'blaze', 'vampire']
-        slayer_icons = {
-            'zombie': '🧟', 'spider': '🕷️', 'wolf': '🐺',
-            'enderman': '👾', 'blaze': '🔥', 'vampire': '🧛'
-        }
-
-        for slayer in slayer_list:
-            slayer_data = slayer_bosses.get(slayer, {})
-            xp = slayer_data.get('xp', 0)
-
-            if slayer in SLAYER_XP:
-                lvl, exact, percent, needed = level_from_xp(xp, SLAYER_XP[slayer])
-
-                icon = slayer_icons.get(slayer, '⚔️')
-                text = f"{icon} {slayer.capitalize()}\n"
-                text += f"Lvl: {int(lvl)}\n"
-                text += f"Prog: {percent:.1f}%\n"
-                text += f"Next: {int(needed):,} XP"
-
-                if slayer in self.slayer_labels:
-                    self.slayer_labels[slayer].setText(text)
+                self.binder.set_text(self.skill_labels[skill], skill_text)
+        for slayer, slayer_text in text['slayers'].items():
+            if slayer in self.slayer_labels:
+                self.binder.set_text(self.slayer_labels[slayer], slayer_text)
 
     # ============== LOAD GENERAL DATA (NEW) ==============
-    def load_general_data(self, member, profile):
-        # ===== SKYBLOCK LEVEL =====
-        leveling = member.get('leveling', {})
-        sb_xp = leveling.get('experience', 0)
-        # Simplified SB level calculation (actual formula is complex)
-        sb_level = int(sb_xp / 100)  # Placeholder calculation
-
-        sb_text = f"Level: {sb_level}\n"
-        sb_text += f"Total XP: {int(sb_xp):,}"
-        self.sb_level_label.setText(sb_text)
-
-        # ===== ACTIVE PET =====
-        pets_data = member.get('pets_data', {})
-        pets = pets_data.get('pets', [])
-
-        active_pet = None
-        for pet in pets:
-            if pet.get('active', False):
-                active_pet = pet
-                break
-
-        if active_pet:
-            pet_type = active_pet.get('type', 'Unknown')
-            tier = active_pet.get('tier', 'COMMON')
-            exp = active_pet.get('exp', 0)
-
-            tier_colors = {
-                'COMMON': '⚪',
-                'UNCOMMON': '🟢',
-                'RARE': '🔵',
-                'EPIC': '🟣',
-                'LEGENDARY': '🟠',
-                'MYTHIC': '🔴'
-            }
-            tier_icon = tier_colors.get(tier, '⚪')
-
-            pet_text = f"{tier_icon} {tier} {pet_type.replace('_', ' ').title()}\n"
-            pet_text += f"Experience: {exp:,}"
-            self.general_pet_label.setText(pet_text)
-        else:
-            self.general_pet_label.setText("No pet currently active")
-
-        # ===== PURSE & BANK =====
-        # Try different possible keys for purse/coins
-        purse = member.get('currencies', {}).get('coin_purse', 0)
-        if purse == 0:
-            purse = member.get('coin_purse', 0)
-        if purse == 0:
-            purse = member.get('currencies', {}).get('coins', 0)
-
-        banking = profile.get('banking', {})
-        bank_balance = banking.get('balance', 0)
-
-        money_text = f"💵 Purse: {purse:,.0f} coins\n"
-        money_text += f"🏦 Bank: {bank_balance:,.0f} coins"
-        self.money_combined_label.setText(money_text)
-
-        # ===== PROFILE INFO =====
-        profile_name = profile.get('cute_name', 'Unknown')
-        game_mode = profile.get('game_mode', 'normal')
-        game_mode_display = {
-            'normal': 'Normal',
-            'ironman': '⚔️ Ironman',
-            'stranded': '🏝️ Stranded',
-            'bingo': '🎯 Bingo'
-        }.get(game_mode, game_mode.title())
-
-        profile_text = f"Profile: {profile_name}\n"
-        profile_text += f"Gamemode: {game_mode_display}"
-        self.profile_info_label.setText(profile_text)
+    def load_general_data(self, view):
+        text = view['text']
+        set_text = self.binder.set_text
+        set_text(self.sb_level_label, text['skyblock_level'])
+        set_text(self.general_pet_label, text['pet'])
+        set_text(self.money_combined_label, text['money'])
+        set_text(self.profile_info_label, text['profile'])
 
     def check_player_ui(self):
-        global current_uuid
-
         name = self.name_input.text().strip()
-
+        
         if not name:
             QMessageBox.warning(self, "⚠️ Error", "Please enter a player name!")
             return
-
+        
+        # A new search replaces whatever is still loading
+        if self.lookup is not None:
+            self.lookup.cancel()
+        
+        self.lookup = PlayerLookup(name, self.thread_pool)
+        self.lookup.resolved.connect(self.on_player_resolved)
+        self.lookup.status_loaded.connect(self.on_status_loaded)
+        self.lookup.profiles_loaded.connect(self.on_profiles_loaded)
+        self.lookup.failed.connect(self.on_lookup_failed)
+        
         self.status_label.setText("⏳ Loading...")
-        self.check_btn.setEnabled(False)
-        QApplication.processEvents()
+        self.thread_pool.start(self.lookup.run)
 
-        # Get UUID
-        uuid = get_uuid(name)
-        if not uuid:
-            self.status_label.setText("❌ Player not found")
-            self.check_btn.setEnabled(True)
+    def on_player_resolved(self, lookup, uuid):
+        if lookup is not self.lookup:
             return
+        self.lookup_uuid = uuid
+        self.update_recent_ui(lookup.name)
 
-        current_uuid = uuid
-        self.update_recent_ui(name)
-
-        # Get online status
-        status_data = hypixel('status', {'uuid': uuid})
-        if status_data and 'session' in status_data:
-            is_online = status_data['session'].get('online', False)
-            status_text = "🟢 ONLINE" if is_online else "⚫ OFFLINE"
-        else:
-            status_text = "❓ Status unknown"
-
-        # Get profiles
-        profiles_data = hypixel('skyblock/profiles', {'uuid': uuid})
-        if not profiles_data or 'profiles' not in profiles_data:
-            self.status_label.setText("❌ Could not load profiles")
-            self.check_btn.setEnabled(True)
+    def on_lookup_failed(self, lookup, error_text):
+        if lookup is not self.lookup:
             return
+        self.status_label.setText(error_text)
 
-        profiles = profiles_data['profiles']
+    def on_status_loaded(self, lookup, status_text):
+        if lookup is not self.lookup:
+            return
+        lookup.status_text = status_text
+        # Before the profiles arrive the label still shows "Loading..."
+        if lookup.profiles_shown:
+            self.show_player_status(lookup)
+
+    def show_player_status(self, lookup):
+        status_text = lookup.status_text or "⏳ Status..."
+        text = f"{status_text} • Player: {lookup.name}"
+        if lookup.cached_age is not None:
+            text += f" • 🕘 cached {format_age(lookup.cached_age)} ago"
+            if lookup.refresh_failed:
+                text += " (refresh failed)"
+        self.status_label.setText(text)
+
+    def on_profiles_loaded(self, lookup, profiles, cached_age):
+        global current_uuid
+        
+        if lookup is not self.lookup:
+            return
+        
+        if profiles is None:
+            if lookup.profiles_shown:
+                # Keep the cached profiles on screen
+                lookup.refresh_failed = True
+                self.show_player_status(lookup)
+            else:
+                self.status_label.setText("❌ Could not load profiles")
+            return
+        
         if not profiles:
             self.status_label.setText("❌ No SkyBlock profiles found")
-            self.check_btn.setEnabled(True)
             return
-
+        
+        current_uuid = self.lookup_uuid
+        
+        # Refreshed profiles replace the cached ones in place, on the profile already picked
+        kept_profile = self.profile_combo.currentText() if lookup.profiles_shown else None
+        
         # Clear and populate profiles
         profiles_cache.clear()
         self.profile_combo.blockSignals(True)
         self.profile_combo.clear()
-
+        
         selected_profile = None
         for p in profiles:
-            if p is None:
-                continue
-            profile_name = p.get('cute_name', 'Unknown')
-            profiles_cache[profile_name] = p
-            self.profile_combo.addItem(profile_name)
-
-            if p.get('selected', False):
-                selected_profile = profile_name
-
+            profiles_cache[p.cute_name] = p
+            self.profile_combo.addItem(p.cute_name)
+            
+            if p.selected:
+                selected_profile = p.cute_name
+        
         self.profile_combo.blockSignals(False)
-
+        
+        if kept_profile in profiles_cache:
+            selected_profile = kept_profile
         if selected_profile and selected_profile in profiles_cache:
             index = self.profile_combo.findText(selected_profile)
             if index >= 0:
                 self.profile_combo.setCurrentIndex(index)
         else:
             self.profile_combo.setCurrentIndex(0)
-
+        
         self.load_profile_ui(self.profile_combo.currentText())
-        self.status_label.setText(f"{status_text} • Player: {name}")
-        self.check_btn.setEnabled(True)
+        lookup.profiles_shown = True
+        lookup.cached_age = cached_age
+        self.show_player_status(lookup)
+
+# ---------------- IPC ----------------
+
+class TrackerServer(QObject):
+    """Localhost line server that receives "open <name>" / "show" messages"""
+    message_received = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.server = QTcpServer(self)
+        self.server.newConnection.connect(self.on_new_connection)
+
+    def listen(self, port=IPC_PORT):
+        return self.server.listen(QHostAddress(IPC_HOST), port)
+
+    def on_new_connection(self):
+        while self.server.hasPendingConnections():
+            conn = self.server.nextPendingConnection()
+            conn.readyRead.connect(lambda c=conn: self.read_messages(c))
+            conn.disconnected.connect(conn.deleteLater)
+
+    def read_messages(self, conn):
+        while conn.canReadLine():
+            line = bytes(conn.readLine()).decode('utf-8', errors='replace').strip()
+            if line:
+                conn.write((IPC_ACK + "\n").encode('utf-8'))
+                self.message_received.emit(line)
 
 # ---------------- RUN APP ----------------
 
 if __name__ == '__main__':
-    app = QApplication(sys.argv)
+    args = parse_args(sys.argv[1:])
+
+    app = create_app(sys.argv)
+    if args.daemon:
+        # Closing only hides the window; the mod reopens it over IPC
+        app.setQuitOnLastWindowClosed(False)
+
+    # Claim the port before building the window; if another launch won the race, hand off to it
+    server = TrackerServer()
+    if not server.listen():
+        if send_to_running_instance(launch_message(args)):
+            sys.exit(0)
+        print(f"Could not listen on {IPC_HOST}:{IPC_PORT}: {server.server.errorString()}")
+
     window = SkyBlockTracker()
+    server.message_received.connect(window.handle_ipc_message)
 
     # Check if player name was passed as argument
-    if len(sys.argv) > 1:
-        player_name = sys.argv[1]
-        window.name_input.setText(player_name)
+    if args.name:
+        window.name_input.setText(args.name)
         # Auto-search after window shows
         QTimer.singleShot(500, window.check_player_ui)
 
@@ -1279,4 +2631,4 @@ if __name__ == '__main__':
     except:
         pass
 
-    sys.exit(app.exec())
\ No newline at end of file
+    sys.exit(app.exec())
@@ -0,0 +1,675 @@
+"""Benchmarks for skyblock_tracker.py
+
+Usage: python benchmarks.py <benchmark> [options]
+Run "python benchmarks.py -h" for the list of benchmarks.
+"""
+import sys
+import gc
+import os
+import io
+import json
+import socket
+import time
+import random
+import timeit
+import argparse
+import contextlib
+import threading
+import statistics
+import subprocess
+import tempfile
+import tracemalloc
+import hashlib
+from urllib.parse import parse_qs, urlsplit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import skyblock_tracker as tracker
+
+# ---------------- Helpers ----------------
+
+def report(label, samples_ms):
+    """Print first / median / p95 / max of a list of millisecond timings"""
+    ordered = sorted(samples_ms)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(f"{label:<34} first {samples_ms[0]:8.3f} ms   median {statistics.median(ordered):8.3f} ms   "
+          f"p95 {p95:8.3f} ms   max {ordered[-1]:8.3f} ms")
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return (time.perf_counter() - start) * 1000
+
+# ---------------- Local API stand-in ----------------
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Answers like Hypixel / Mojang with small canned bodies, keeping connections alive"""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    handshake_delay = 0.0
+    response_delay = 0.0
+    # Served for skyblock/profiles when set, with __UUID__ replaced by the requested uuid
+    profiles_body = None
+    connections = 0
+
+    def setup(self):
+        # Stand-in for the TCP + TLS handshake a new connection to the real API pays
+        time.sleep(self.handshake_delay)
+        StandInHandler.connections += 1
+        super().setup()
+
+    def do_GET(self):
+        # Stand-in for the API's own response time
+        time.sleep(self.response_delay)
+        if self.path.startswith("/mojang/"):
+            payload = json.dumps({"id": "0123456789abcdef0123456789abcdef", "name": "Stand_In"}).encode('utf-8')
+        elif self.path.startswith("/v2/skyblock/profiles") and self.profiles_body is not None:
+            uuid = parse_qs(urlsplit(self.path).query).get('uuid', [''])[0]
+            payload = self.profiles_body.replace(b"__UUID__", uuid.encode('utf-8'))
+        else:
+            payload = json.dumps({"success": True, "session": {"online": False}}).encode('utf-8')
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self):
+        # Mojang's bulk lookup: every name exists, with a UUID derived from it
+        names = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        payload = json.dumps([{"id": hashlib.md5(name.encode('utf-8')).hexdigest(), "name": name}
+                              for name in names]).encode('utf-8')
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_stand_in(handshake_ms=0.0, latency_ms=0.0):
+    """Serve StandInHandler on a free localhost port and point the tracker at it"""
+    StandInHandler.handshake_delay = handshake_ms / 1000
+    StandInHandler.response_delay = latency_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    tracker.HYPIXEL_API = f"{base}/v2"
+    tracker.MOJANG_API = f"{base}/mojang"
+    tracker.close_sessions()
+    return server
+
+def disable_response_cache():
+    """Keep cached responses out of timings that are meant to hit the network"""
+    tracker.CACHE_TTLS = {endpoint: (0, 0) for endpoint in tracker.CACHE_TTLS}
+    tracker.response_cache = tracker.ResponseCache(":memory:")
+
+# ---------------- Reference implementations ----------------
+
+def legacy_level_from_xp(xp, curve):
+    """The linear scan LevelCurve replaced, kept for comparison"""
+    if xp <= 0:
+        return 0, 0.0, 0.0, curve[1] if len(curve) > 1 else 0
+
+    for lvl in range(len(curve)-1):
+        if xp < curve[lvl+1]:
+            base = curve[lvl]
+            nxt = curve[lvl+1]
+            frac = (xp-base)/(nxt-base) if nxt > base else 0
+            return lvl, lvl+frac, frac*100, nxt-xp
+
+    max_lvl = len(curve)-1
+    return max_lvl, float(max_lvl), 100.0, 0
+
+def large_coop_response(rng, args, uuid):
+    """A skyblock/profiles response with args.profiles coop profiles of args.members members each"""
+    return {'success': True,
+            'profiles': [sample_profile(rng, args.members, args.padding, uuid) for _ in range(args.profiles)]}
+
+def chained_member_fields(member):
+    """The .get() chains MEMBER_SCHEMA replaced, kept for comparison"""
+    dungeon = member.get('dungeons', {})
+    dungeon_types = dungeon.get('dungeon_types', {})
+    cat = dungeon_types.get('catacombs', {})
+    master_cat = dungeon_types.get('master_catacombs', {})
+    player_classes = dungeon.get('player_classes', {})
+    experience = member.get('player_data', {}).get('experience', {})
+    slayer_bosses = member.get('slayer', {}).get('slayer_bosses', {})
+    fields = {
+        'last_save': member.get('last_save') or member.get('profile', {}).get('last_save'),
+        'catacombs_xp': cat.get('experience', 0),
+        'secrets': dungeon.get('secrets', 0),
+        'magical_power': member.get('accessory_bag_storage', {}).get('highest_magical_power', 0),
+        'class_xp': {cls: player_classes.get(cls, {}).get('experience', 0) for cls in tracker.CLASS_LIST},
+        'skill_xp': {skill: experience.get(f'SKILL_{skill.upper()}', 0) for skill in tracker.SKILL_LIST},
+        'slayer_xp': {slayer: slayer_bosses.get(slayer, {}).get('xp', 0) for slayer in tracker.SLAYER_LIST},
+        'skyblock_xp': member.get('leveling', {}).get('experience', 0),
+        'pet': tracker.active_pet(member.get('pets_data', {}).get('pets', [])),
+    }
+    for attribute, key in (('floor_runs', 'tier_completions'), ('floor_best', 'best_score'),
+                           ('floor_fastest', 'fastest_time_s_plus')):
+        fields[attribute] = {name: (cat if dungeon_type == 'catacombs' else master_cat).get(key, {}).get(tier, 0)
+                             for name, dungeon_type, tier in tracker.FLOOR_LIST}
+    purse = member.get('currencies', {}).get('coin_purse', 0)
+    if purse == 0:
+        purse = member.get('coin_purse', 0)
+    if purse == 0:
+        purse = member.get('currencies', {}).get('coins', 0)
+    fields['purse'] = purse
+    return fields
+
+def profile_level_lookups(rng):
+    """(xp table, LevelCurve, xp) for every level lookup one profile render does"""
+    lookups = [(tracker.CATACOMBS_XP, tracker.CATACOMBS_CURVE, rng.uniform(0, tracker.CATACOMBS_XP[-1]))]
+    lookups += [(tracker.CLASS_XP, tracker.CLASS_CURVE, rng.uniform(0, tracker.CLASS_XP[-1])) for _ in range(5)]
+    for _ in range(9):
+        lookups.append((tracker.SKILL_XP_NORMAL, tracker.SKILL_CURVE, rng.uniform(0, tracker.SKILL_XP_NORMAL[-1])))
+    for skill, table in (('runecrafting', tracker.SKILL_XP_RUNECRAFTING), ('social', tracker.SKILL_XP_SOCIAL)):
+        lookups.append((table, tracker.SKILL_CURVES[skill], rng.uniform(0, table[-1])))
+    for slayer, table in tracker.SLAYER_XP.items():
+        lookups.append((table, tracker.SLAYER_CURVES[slayer], rng.uniform(0, table[-1])))
+    return lookups
+
+def sample_profile(rng, members=1, padding=0, uuid=None):
+    """A profiles-endpoint entry with random stats; padding adds fields the panels never read"""
+    def member():
+        data = {
+            'dungeons': {
+                'dungeon_types': {
+                    'catacombs': {'experience': rng.uniform(0, tracker.CATACOMBS_XP[-1]),
+                                  'tier_completions': {str(i): rng.randint(0, 900) for i in range(8)},
+                                  'best_score': {str(i): rng.randint(0, 317) for i in range(8)},
+                                  'fastest_time_s_plus': {str(i): rng.randint(60000, 600000) for i in range(8)}},
+                    'master_catacombs': {'tier_completions': {str(i): rng.randint(0, 500) for i in range(1, 8)},
+                                         'best_score': {str(i): rng.randint(0, 317) for i in range(1, 8)},
+                                         'fastest_time_s_plus': {str(i): rng.randint(60000, 600000) for i in range(1, 8)}},
+                },
+                'secrets': rng.randint(0, 50000),
+                'player_classes': {cls: {'experience': rng.uniform(0, tracker.CLASS_XP[-1])} for cls in tracker.CLASS_LIST},
+            },
+            'accessory_bag_storage': {'highest_magical_power': rng.randint(0, 1700)},
+            'player_data': {'experience': {f'SKILL_{skill.upper()}': rng.uniform(0, tracker.SKILL_XP_NORMAL[-1])
+                                           for skill in tracker.SKILL_LIST}},
+            'slayer': {'slayer_bosses': {slayer: {'xp': rng.randint(0, 3000000)} for slayer in tracker.SLAYER_LIST}},
+            'leveling': {'experience': rng.randint(0, 40000)},
+            'pets_data': {'pets': [{'type': 'ENDER_DRAGON', 'tier': 'LEGENDARY', 'exp': 123456.0, 'active': True}]},
+            'currencies': {'coin_purse': rng.uniform(0, 1e9)},
+        }
+        if padding:
+            data['inventory'] = {'inv_contents': {'type': 0, 'data': 'H4sI' + 'A' * padding}}
+            data['collection'] = {f'ITEM_{i}': rng.randint(0, 10 ** 7) for i in range(padding // 100)}
+        return data
+
+    uuids = [uuid or f"{rng.getrandbits(128):032x}"] + [f"{rng.getrandbits(128):032x}" for _ in range(members - 1)]
+    return {'profile_id': f"{rng.getrandbits(128):032x}", 'cute_name': 'Apple', 'game_mode': 'normal',
+            'banking': {'balance': rng.uniform(0, 1e9)}, 'members': {uuid: member() for uuid in uuids}}
+
+def reset_peak_rss():
+    """Restart peak RSS tracking from the current RSS (Linux only), returning whether it worked"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+def peak_rss_kb():
+    """Highest resident set size of this process (since reset_peak_rss()), or None if unknown"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux kilobytes
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+# ---------------- Benchmarks ----------------
+
+def bench_http(args):
+    """Per-request latency of hypixel()/get_uuid() with pooled sessions vs. one connection per call"""
+    import requests
+
+    disable_response_cache()
+    server = start_stand_in(args.handshake_ms)
+    uuid = "0123456789abcdef0123456789abcdef"
+    try:
+        unpooled = [timed(requests.get, f"{tracker.HYPIXEL_API}/status", None) for _ in range(args.requests)]
+        report("requests.get (new connection)", unpooled)
+
+        report("hypixel('status') pooled",
+               [timed(tracker.hypixel, 'status', {'uuid': uuid}) for _ in range(args.requests)])
+        report("get_uuid() pooled",
+               [timed(tracker.get_uuid, "Stand_In") for _ in range(args.requests)])
+    finally:
+        server.shutdown()
+        tracker.close_sessions()
+
+def bench_levels(args):
+    """level_from_xp linear scan vs. LevelCurve bisect, per profile render and per lookup"""
+    rng = random.Random(26)
+    lookups = profile_level_lookups(rng)
+
+    # Both must agree inside the tables (overflow levels are new)
+    for table, curve, _ in lookups:
+        for xp in [0, -1, *table[:-1]] + [rng.uniform(0, table[-1]) for _ in range(200)]:
+            assert legacy_level_from_xp(xp, table) == curve.level(xp), (table, xp)
+
+    def legacy():
+        for table, _, xp in lookups:
+            legacy_level_from_xp(xp, table)
+
+    def bisected():
+        for _, curve, xp in lookups:
+            curve.level(xp)
+
+    for label, fn in (("level_from_xp (linear)", legacy), ("LevelCurve.level (bisect)", bisected)):
+        per_render = min(timeit.repeat(fn, number=args.iterations, repeat=5)) / args.iterations
+        print(f"{label:<28} {per_render * 1e6:8.2f} us per render   "
+              f"{per_render / len(lookups) * 1e9:8.1f} ns per lookup")
+
+    # Bulk scans: one curve, many players
+    xps = [rng.uniform(0, tracker.SKILL_XP_NORMAL[-1]) for _ in range(args.players)]
+    curve = tracker.SKILL_CURVE
+    loop = min(timeit.repeat(lambda: [legacy_level_from_xp(xp, curve.thresholds) for xp in xps], number=1, repeat=3))
+    print(f"{'level_from_xp x ' + str(args.players):<28} {loop * 1000:8.2f} ms")
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    if numpy is None:
+        print("LevelCurve.levels runs in plain Python (NumPy not installed)")
+    saved = tracker.NUMPY_MIN_BATCH
+    try:
+        tracker.NUMPY_MIN_BATCH = len(xps) + 1
+        plain = min(timeit.repeat(lambda: curve.levels(xps), number=1, repeat=3))
+        print(f"{'LevelCurve.levels (Python)':<28} {plain * 1000:8.2f} ms")
+        if numpy is not None:
+            tracker.NUMPY_MIN_BATCH = 0
+            vectorized = min(timeit.repeat(lambda: curve.levels(xps), number=1, repeat=3))
+            print(f"{'LevelCurve.levels (NumPy)':<28} {vectorized * 1000:8.2f} ms")
+    finally:
+        tracker.NUMPY_MIN_BATCH = saved
+
+    top = tracker.CATACOMBS_XP[-1]
+    print(f"Catacombs at {top + 3.5 * tracker.CATACOMBS_OVERFLOW_XP:,.0f} XP -> "
+          f"{tracker.CATACOMBS_CURVE.level(top + 3.5 * tracker.CATACOMBS_OVERFLOW_XP)[1]:.2f} "
+          f"(linear scan stops at {legacy_level_from_xp(top * 2, tracker.CATACOMBS_XP)[1]:.2f})")
+
+def bench_render(args):
+    """Building the three panels' view models for a profile switch, uncached vs. from the derived-stats cache"""
+    rng = random.Random(26)
+    raw = sample_profile(rng, padding=args.padding)
+    profile = tracker.ProfileRecord(raw, next(iter(raw['members'])))
+
+    def render():
+        version = tracker.member_version(profile)
+        for panel in tracker.PANEL_DERIVERS:
+            tracker.derived_view(panel, profile, version)
+
+    def uncached():
+        tracker.derived_cache.clear()
+        render()
+
+    for label, fn in (("derive all panels (cold)", uncached), ("derive all panels (cached)", render)):
+        report(label, [timed(fn) for _ in range(args.iterations)])
+
+def bench_refresh(args):
+    """Refreshing the tab on screen when only the bank balance moved, with and without skipping unchanged labels"""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    app = tracker.create_app(sys.argv[:1])
+    tracker.RECENT_PLAYERS_FILE = os.path.join(tempfile.mkdtemp(), 'recent_players.json')
+    window = tracker.SkyBlockTracker()
+    window.resize(1600, 900)
+    window.show()
+    rng = random.Random(26)
+    raw = sample_profile(rng)
+    uuid = next(iter(raw['members']))
+
+    def refresh(forget):
+        if forget:
+            # What every refresh did before: all labels set again
+            window.binder.last_text.clear()
+        raw['banking']['balance'] += 1e6
+        tracker.profiles_cache[raw['cute_name']] = tracker.ProfileRecord(raw, uuid)
+        window.load_profile_ui(raw['cute_name'])
+        # Let the relayouts and repaints the setText() calls scheduled run
+        app.processEvents()
+
+    for index, (panel, tab_title, build, load) in enumerate(window.TABS):
+        window.tabs.setCurrentIndex(index)
+        refresh(True)
+        for label, forget in (("always setText", True), ("ViewBinder", False)):
+            binder = window.binder
+            binder.updated = binder.skipped = 0
+            report(f"{panel}, {label}", [timed(refresh, forget) for _ in range(args.iterations)])
+        print(f"{'':<34} ViewBinder set {binder.updated} labels, skipped {binder.skipped}")
+    window.close()
+
+def bench_lookup(args):
+    """Searching a recent player again once the cache is past its TTL: time until panels show, and until fresh"""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    app = tracker.create_app(sys.argv[:1])
+    tracker.RECENT_PLAYERS_FILE = os.path.join(tempfile.mkdtemp(), 'recent_players.json')
+    tracker.response_cache = tracker.ResponseCache(":memory:")
+    rng = random.Random(26)
+    uuid = "0123456789abcdef0123456789abcdef"
+    StandInHandler.profiles_body = json.dumps({'success': True, 'profiles': [sample_profile(rng, uuid=uuid)]}).encode('utf-8')
+    server = start_stand_in(args.handshake_ms, args.latency_ms)
+    window = tracker.SkyBlockTracker()
+    shown = []
+    show_profiles = window.on_profiles_loaded
+
+    def on_profiles_loaded(lookup, profiles, cached_age):
+        show_profiles(lookup, profiles, cached_age)
+        shown.append((time.perf_counter(), cached_age))
+    window.on_profiles_loaded = on_profiles_loaded
+
+    def search():
+        shown.clear()
+        window.name_input.setText("Stand_In")
+        start = time.perf_counter()
+        window.check_player_ui()
+        while not shown or shown[-1][1] is not None:
+            app.processEvents()
+            time.sleep(0.0005)
+        return [(at - start) * 1000 for at, cached_age in shown]
+
+    try:
+        search()
+        first, fresh = [], []
+        for _ in range(args.requests):
+            # Age the cached entries past their TTL, as for a player looked up earlier in the day
+            conn = tracker.response_cache._connect()
+            conn.execute("UPDATE responses SET stored_at = stored_at - ?",
+                         (tracker.CACHE_TTLS['skyblock/profiles'][0],))
+            conn.commit()
+            times = search()
+            first.append(times[0])
+            fresh.append(times[-1])
+        print(f"Stand-in API answering in {args.latency_ms:.0f} ms")
+        report("panels shown (cached)", first)
+        report("panels refreshed", fresh)
+    finally:
+        window.close()
+        server.shutdown()
+
+def bench_batch(args):
+    """Scanning a list of players with one worker vs. --workers, against a stand-in API with --latency-ms"""
+    rng = random.Random(26)
+    StandInHandler.profiles_body = json.dumps(
+        {'success': True, 'profiles': [sample_profile(rng, uuid="__UUID__")]}).encode('utf-8')
+    server = start_stand_in(args.handshake_ms, args.latency_ms)
+    names = [f"Applicant_{i}" for i in range(args.batch_size)]
+    print(f"{len(names)} players, stand-in API answering in {args.latency_ms:.0f} ms")
+    try:
+        for workers in sorted({1, args.workers}):
+            # Every run starts cold; the names table keeps the UUIDs the bulk lookup stores
+            tracker.response_cache = tracker.ResponseCache(":memory:")
+            tracker.hypixel_limiter = tracker.RateLimiter()
+            start = time.perf_counter()
+            first = None
+            documents = 0
+            for document in tracker.scan_players(names, workers):
+                assert 'error' not in document, document
+                documents += 1
+                if first is None:
+                    first = time.perf_counter() - start
+            total = time.perf_counter() - start
+            print(f"{workers:>3} workers: first line after {first * 1000:7.1f} ms, all {documents} after "
+                  f"{total * 1000:8.1f} ms ({documents / total:6.1f} players/s)")
+    finally:
+        server.shutdown()
+
+def bench_serve(args):
+    """GET /player/<name> from a --serve server: the cold request and the warm ones after it"""
+    import requests
+    rng = random.Random(26)
+    StandInHandler.profiles_body = json.dumps(
+        {'success': True, 'profiles': [sample_profile(rng, uuid="__UUID__")]}).encode('utf-8')
+    stand_in = start_stand_in(args.handshake_ms, args.latency_ms)
+    tracker.response_cache = tracker.ResponseCache(":memory:")
+    with socket.socket() as probe:
+        probe.bind((tracker.SERVE_HOST, 0))
+        port = probe.getsockname()[1]
+    serve_args = argparse.Namespace(port=port)
+    threading.Thread(target=tracker.run_serve, args=(serve_args,), daemon=True).start()
+
+    session = requests.Session()
+    url = f"http://{tracker.SERVE_HOST}:{port}/player/Stand_In"
+    print(f"Stand-in API answering in {args.latency_ms:.0f} ms")
+    # The server's access log goes to stderr; keep it out of the report
+    try:
+        with contextlib.redirect_stderr(io.StringIO()):
+            for _ in range(100):
+                try:
+                    session.get(f"http://{tracker.SERVE_HOST}:{port}/")
+                    break
+                except requests.ConnectionError:
+                    time.sleep(0.05)
+            cold = timed(lambda: session.get(url).raise_for_status())
+            warm = [timed(lambda: session.get(url).raise_for_status()) for _ in range(args.requests)]
+            warm_profile = [timed(lambda: session.get(url + "/profile/Apple").raise_for_status())
+                            for _ in range(args.requests)]
+    finally:
+        stand_in.shutdown()
+    print(f"{'cold /player/<name>':<34} {cold:8.3f} ms")
+    report("warm /player/<name>", warm)
+    report("warm /player/<name>/profile/Apple", warm_profile)
+
+def memory_child(args):
+    """Load the fixture the way the tracker does and print memory figures as JSON (runs in a fresh process)"""
+    if args.child == 'stream':
+        # stream_profiles() imports ijson on first use; that would count as kept memory
+        import ijson
+    # Importing the tracker (and PyQt6 with it) is most of the RSS; only growth from here is reported
+    baseline = peak_rss_kb() if reset_peak_rss() else None
+    if args.trace:
+        tracemalloc.start()
+    with open(args.fixture, 'rb') as f:
+        if args.child == 'stream':
+            data = tracker.stream_profiles(f, {'uuid': args.uuid})
+        else:
+            data = json.loads(f.read())
+    if args.child != 'raw':
+        kept = tracker.profile_records(data, args.uuid)
+        del data
+    else:
+        kept = data
+    gc.collect()
+    # Freed memory often stays resident, so what is kept is measured on the Python heap
+    retained = tracemalloc.get_traced_memory()[0] // 1024 if args.trace else None
+    peak = peak_rss_kb()
+    print(json.dumps({'peak_kb': peak - baseline if baseline is not None else None, 'retained_kb': retained,
+                      'profiles': len(kept['profiles'] if args.child == 'raw' else kept)}))
+
+def bench_memory(args):
+    """Peak RSS and kept memory of a large coop response: raw dicts, ProfileRecords, streamed ProfileRecords"""
+    rng = random.Random(26)
+    uuid = f"{rng.getrandbits(128):032x}"
+    response = large_coop_response(rng, args, uuid)
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+        json.dump(response, f)
+        fixture = f.name
+    del response
+    try:
+        print(f"Fixture: {args.profiles} profiles x {args.members} members, "
+              f"{os.path.getsize(fixture) / 1e6:.1f} MB of JSON")
+        def child(mode, *extra):
+            out = subprocess.run([sys.executable, os.path.abspath(__file__), 'memory', '--child', mode,
+                                  '--fixture', fixture, '--uuid', uuid, *extra],
+                                 capture_output=True, text=True, check=True).stdout
+            return json.loads(out.splitlines()[-1])
+
+        fmt = lambda kb: f"{kb / 1024:8.2f} MB" if kb is not None else "     n/a"
+        modes = [('raw', "raw JSON dicts"), ('records', "ProfileRecords")]
+        try:
+            import ijson
+            modes.append(('stream', "streamed records"))
+        except ImportError:
+            print("streamed records: ijson not installed")
+        for mode, label in modes:
+            # Tracing inflates RSS, so the peak comes from a separate untraced run
+            peak = child(mode)['peak_kb']
+            retained = child(mode, '--trace')['retained_kb']
+            print(f"{label:<16} peak RSS growth {fmt(peak)}   kept after load {fmt(retained)}")
+    finally:
+        os.remove(fixture)
+
+def bench_extract(args):
+    """Reading a member's panel fields with chained .get() calls vs. the compiled MEMBER_SCHEMA"""
+    rng = random.Random(26)
+    full = next(iter(sample_profile(rng, padding=args.padding)['members'].values()))
+    sparse = {'player_data': full['player_data'], 'leveling': full['leveling']}
+
+    for label, member in (("full member", full), ("sparse member", sparse)):
+        assert chained_member_fields(member) == tracker.MEMBER_SCHEMA.extract(member)
+        for name, fn in (("chained .get()", chained_member_fields), ("MEMBER_SCHEMA", tracker.MEMBER_SCHEMA.extract)):
+            per_call = min(timeit.repeat(lambda: fn(member), number=args.iterations, repeat=5)) / args.iterations
+            print(f"{name + ', ' + label:<34} {per_call * 1e6:8.2f} us")
+
+def bench_decode(args):
+    """Decode time and allocations of a profiles response: per JSON backend, full vs. decode_profiles(), and streamed"""
+    if args.payload:
+        # A recorded response body, e.g. saved from the API with curl
+        with open(args.payload, 'rb') as f:
+            body = f.read()
+        uuid = args.uuid or next(iter(json.loads(body)['profiles'][0]['members']))
+    else:
+        rng = random.Random(26)
+        uuid = f"{rng.getrandbits(128):032x}"
+        body = json.dumps(large_coop_response(rng, args, uuid)).encode('utf-8')
+    print(f"Payload: {len(body) / 1e6:.1f} MB")
+
+    def measure(label, decode):
+        decode()
+        times = [timed(decode) for _ in range(args.runs)]
+        gc.collect()
+        tracemalloc.start()
+        data = decode()
+        kept, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del data
+        report(label, times)
+        print(f"{'':<34} allocated peak {peak / 1e6:8.2f} MB   kept {kept / 1e6:8.2f} MB")
+
+    saved = tracker.JSON_BACKEND
+    try:
+        for backend in tracker.JSON_BACKENDS:
+            try:
+                tracker.json_decoder(backend)
+            except ImportError:
+                print(f"{backend}: not installed")
+                continue
+            tracker.JSON_BACKEND = backend
+            measure(f"{backend} full", lambda: tracker.json_loads(body))
+            measure(f"{backend} decode_profiles", lambda: tracker.decode_profiles(body, {'uuid': uuid}))
+    finally:
+        tracker.JSON_BACKEND = saved
+
+    try:
+        import ijson
+    except ImportError:
+        print("stream_profiles: ijson not installed")
+        return
+    # Allocations here exclude the body, which a streamed download never holds in full
+    measure("stream_profiles (ijson)", lambda: tracker.stream_profiles(io.BytesIO(body), {'uuid': uuid}))
+
+def window_child(args):
+    """Build the tracker window --runs times and print construction / first-paint timings as JSON (fresh process)"""
+    import importlib.util
+    from PyQt6.QtWidgets import QApplication
+    spec = importlib.util.spec_from_file_location('tracker_under_test', args.script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    # No recent players, so building the window starts no UUID lookups
+    module.RECENT_PLAYERS_FILE = os.path.join(tempfile.mkdtemp(), 'recent_players.json')
+    create_app = getattr(module, 'create_app', QApplication)
+    app = create_app(sys.argv[:1])
+    build, paint = [], []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        window = module.SkyBlockTracker()
+        built = time.perf_counter()
+        window.resize(1600, 900)
+        # grab() polishes, lays out and paints the whole window off screen
+        window.grab()
+        painted = time.perf_counter()
+        build.append((built - start) * 1000)
+        paint.append((painted - built) * 1000)
+        window.deleteLater()
+        app.processEvents()
+    print(json.dumps({'build_ms': build, 'paint_ms': paint}))
+
+def bench_window(args):
+    """Constructing the main window and painting it for the first time, optionally against an older script"""
+    scripts = [("current", os.path.abspath(tracker.__file__))]
+    if args.compare:
+        scripts.insert(0, (os.path.basename(args.compare), os.path.abspath(args.compare)))
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    for label, script in scripts:
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), 'window', '--child', 'window',
+                              '--script', script, '--runs', str(args.runs)],
+                             capture_output=True, text=True, check=True, env=env).stdout
+        result = json.loads(out.splitlines()[-1])
+        report(f"{label}: build window", result['build_ms'])
+        report(f"{label}: first paint", result['paint_ms'])
+
+BENCHMARKS = {
+    'batch': bench_batch,
+    'http': bench_http,
+    'decode': bench_decode,
+    'extract': bench_extract,
+    'levels': bench_levels,
+    'lookup': bench_lookup,
+    'memory': bench_memory,
+    'refresh': bench_refresh,
+    'render': bench_render,
+    'serve': bench_serve,
+    'window': bench_window,
+}
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="SkyBlock Tracker benchmarks")
+    parser.add_argument('benchmark', choices=sorted(BENCHMARKS))
+    parser.add_argument('-n', '--requests', type=int, default=200, help="requests per measurement (http, lookup, serve)")
+    parser.add_argument('-i', '--iterations', type=int, default=2000, help="timing loop iterations (levels, render, extract, refresh)")
+    parser.add_argument('--players', type=int, default=10000, help="XP values in the bulk scan (levels)")
+    parser.add_argument('--padding', type=int, default=200000,
+                        help="bytes of unrelated data (inventories, collections) per member (render, memory)")
+    parser.add_argument('--profiles', type=int, default=5, help="profiles in the coop fixture (memory, decode)")
+    parser.add_argument('--members', type=int, default=5,
+                        help="members per profile in the coop fixture (memory, decode)")
+    parser.add_argument('--runs', type=int, default=10, help="timed runs per measurement (decode, window)")
+    parser.add_argument('--payload', help="recorded skyblock/profiles response to decode instead of the fixture (decode)")
+    parser.add_argument('--uuid', help="member to keep from --payload, default the first one (decode)")
+    parser.add_argument('--compare', help="older skyblock_tracker.py to time alongside the current one (window)")
+    parser.add_argument('--child', choices=['raw', 'records', 'stream', 'window'], help=argparse.SUPPRESS)
+    parser.add_argument('--fixture', help=argparse.SUPPRESS)
+    parser.add_argument('--script', help=argparse.SUPPRESS)
+    parser.add_argument('--trace', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--handshake-ms', type=float, default=0.0,
+                        help="simulated cost of opening a new connection to the stand-in server (http, lookup, batch, serve)")
+    parser.add_argument('--latency-ms', type=float, default=150.0,
+                        help="simulated response time of the stand-in server (lookup, batch, serve)")
+    parser.add_argument('--batch-size', type=int, default=50, help="players in the scanned list (batch)")
+    parser.add_argument('--workers', type=int, default=tracker.HTTP_POOL_SIZE,
+                        help="workers to compare with a single one (batch)")
+    args = parser.parse_args(argv)
+    if args.child == 'window':
+        window_child(args)
+        return
+    if args.child:
+        memory_child(args)
+        return
+    BENCHMARKS[args.benchmark](args)
+
+if __name__ == '__main__':
+    main(sys.argv[1:])